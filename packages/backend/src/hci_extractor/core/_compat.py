@@ -0,0 +1,9 @@
+"""Python version compatibility helpers shared across the core package."""
+
+import sys
+from typing import Any, Dict
+
+# Keyword arguments for ``@dataclass(frozen=True, **_SLOTS)``. Slotted
+# instances drop the per-instance __dict__, which keeps the many small
+# models light and attribute reads direct; dataclass slots need 3.10+
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
@@ -9,10 +9,12 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from hci_extractor.core._compat import _SLOTS
+from hci_extractor.core.models.exceptions import ConfigurationError
 from hci_extractor.core.ports import ConfigurationPort
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class ConfigurationData:
     """Immutable configuration data loaded from configuration sources."""
 
@@ -38,7 +40,7 @@ class ConfigurationData:
     general: Dict[str, Any]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class ExtractionConfig:
     """Configuration for PDF extraction operations."""
 
@@ -48,7 +50,7 @@ class ExtractionConfig:
     extract_positions: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class AnalysisConfig:
     """Configuration for LLM analysis operations."""
 
@@ -61,8 +63,17 @@ class AnalysisConfig:
     temperature: float
     max_output_tokens: int
 
+    def __post_init__(self) -> None:
+        """Validate settings that size runtime resources."""
+        # Sizes the provider's request semaphore: 0 would block every request
+        if self.max_concurrent_sections < 1:
+            raise ConfigurationError(
+                "analysis.max_concurrent_sections must be at least 1, "
+                f"got {self.max_concurrent_sections}",
+            )
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, **_SLOTS)
 class RetryConfig:
     """Configuration for retry behavior."""
 
@@ -72,7 +83,7 @@ class RetryConfig:
     max_delay_seconds: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class CacheConfig:
     """Configuration for caching behavior."""
 
@@ -82,7 +93,7 @@ class CacheConfig:
     max_size_mb: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class ApiConfig:
     """Configuration for API settings."""
 
@@ -94,7 +105,7 @@ class ApiConfig:
     timeout_seconds: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class ExportConfig:
     """Configuration for export operations."""
 
@@ -104,7 +115,7 @@ class ExportConfig:
     timestamp_format: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class ExtractorConfig:
     """Main configuration object containing all sub-configurations."""
 
@@ -235,50 +246,47 @@ class ExtractorConfig:
             max_output_tokens=int(analysis_data.get("max_output_tokens", 100000)),
         )
 
+        api_data = config_dict.get("api", {})
         api = ApiConfig(
-            provider_type=config_dict.get("api", {}).get("provider_type", "gemini"),
-            gemini_api_key=config_dict.get("api", {}).get("gemini_api_key"),
-            openai_api_key=config_dict.get("api", {}).get("openai_api_key"),
-            anthropic_api_key=config_dict.get("api", {}).get("anthropic_api_key"),
-            rate_limit_delay=config_dict.get("api", {}).get("rate_limit_delay", 1.0),
-            timeout_seconds=config_dict.get("api", {}).get("timeout_seconds", 30.0),
+            provider_type=str(api_data.get("provider_type", "gemini")),
+            gemini_api_key=api_data.get("gemini_api_key"),
+            openai_api_key=api_data.get("openai_api_key"),
+            anthropic_api_key=api_data.get("anthropic_api_key"),
+            rate_limit_delay=float(api_data.get("rate_limit_delay", 1.0)),
+            timeout_seconds=float(api_data.get("timeout_seconds", 30.0)),
         )
 
+        retry_data = config_dict.get("retry", {})
         retry = RetryConfig(
-            max_attempts=config_dict.get("retry", {}).get("max_attempts", 3),
-            initial_delay_seconds=config_dict.get("retry", {}).get(
-                "initial_delay_seconds", 2.0
-            ),
-            backoff_multiplier=config_dict.get("retry", {}).get(
-                "backoff_multiplier", 2.0
-            ),
-            max_delay_seconds=config_dict.get("retry", {}).get(
-                "max_delay_seconds", 30.0
+            max_attempts=int(retry_data.get("max_attempts", 3)),
+            initial_delay_seconds=float(
+                retry_data.get("initial_delay_seconds", 2.0),
             ),
+            backoff_multiplier=float(retry_data.get("backoff_multiplier", 2.0)),
+            max_delay_seconds=float(retry_data.get("max_delay_seconds", 30.0)),
         )
 
+        cache_data = config_dict.get("cache", {})
         cache = CacheConfig(
-            enabled=config_dict.get("cache", {}).get("enabled", False),
+            enabled=bool(cache_data.get("enabled", False)),
             directory=None,
-            ttl_seconds=config_dict.get("cache", {}).get("ttl_seconds", 3600),
-            max_size_mb=config_dict.get("cache", {}).get("max_size_mb", 1000),
+            ttl_seconds=int(cache_data.get("ttl_seconds", 3600)),
+            max_size_mb=int(cache_data.get("max_size_mb", 1000)),
         )
 
+        export_data = config_dict.get("export", {})
         export = ExportConfig(
-            include_metadata=config_dict.get("export", {}).get(
-                "include_metadata", True
+            include_metadata=bool(export_data.get("include_metadata", True)),
+            include_confidence=bool(export_data.get("include_confidence", True)),
+            min_confidence_threshold=float(
+                export_data.get("min_confidence_threshold", 0.0),
             ),
-            include_confidence=config_dict.get("export", {}).get(
-                "include_confidence", True
-            ),
-            min_confidence_threshold=config_dict.get("export", {}).get(
-                "min_confidence_threshold", 0.0
-            ),
-            timestamp_format=config_dict.get("export", {}).get(
-                "timestamp_format", "%Y-%m-%d %H:%M:%S"
+            timestamp_format=str(
+                export_data.get("timestamp_format", "%Y-%m-%d %H:%M:%S"),
             ),
         )
 
+        general_data = config_dict.get("general", {})
         return cls(
             extraction=extraction,
             analysis=analysis,
@@ -286,8 +294,6 @@ class ExtractorConfig:
             retry=retry,
             cache=cache,
             export=export,
-            prompts_directory=Path(
-                config_dict.get("general", {}).get("prompts_directory", "prompts")
-            ),
-            log_level=config_dict.get("general", {}).get("log_level", "INFO"),
+            prompts_directory=Path(general_data.get("prompts_directory", "prompts")),
+            log_level=str(general_data.get("log_level", "INFO")),
         )
@@ -267,6 +267,9 @@ class DIContainer:
                     event_bus=event_bus,
                     markup_prompt_loader=prompt_loader,
                     model_name=self.config.analysis.model_name,
+                    max_concurrent_requests=(
+                        self.config.analysis.max_concurrent_sections
+                    ),
                 )
             if provider_type == "openai":
                 raise NotImplementedError("OpenAI provider not yet implemented")
@@ -343,13 +346,21 @@ def configure_services(container: DIContainer) -> None:
     # Import the actual class for registration
     from hci_extractor.prompts.markup_prompt_loader import MarkupPromptLoader
 
-    container.register_factory(MarkupPromptLoader, create_markup_prompt_loader)
+    container.register_factory(
+        MarkupPromptLoader,
+        create_markup_prompt_loader,
+        ServiceLifetime.SINGLETON,
+    )
 
-    # Register PDF extractor factory with config dependency
+    # Register PDF extractor as singleton; it keeps no per-file state
     def create_pdf_extractor(config: ExtractorConfig) -> PdfExtractor:
         return PdfExtractor(config=config)
 
-    container.register_factory(PdfExtractor, create_pdf_extractor)
+    container.register_factory(
+        PdfExtractor,
+        create_pdf_extractor,
+        ServiceLifetime.SINGLETON,
+    )
 
     # Register retry handler factory that creates instances with dependencies
     def create_retry_handler(event_bus: EventBus) -> RetryHandler:
@@ -385,11 +396,35 @@ def configure_services(container: DIContainer) -> None:
                 event_bus=event_bus,
                 markup_prompt_loader=markup_prompt_loader,
                 model_name=config.analysis.model_name,
+                max_concurrent_requests=config.analysis.max_concurrent_sections,
             )
         raise ValueError(f"Unsupported provider type: {provider_type}")
 
-    # Register the configurable provider factory for the abstract interface
-    container.register_factory(LLMProviderPort, create_llm_provider)
+    # Serve repeated papers from the markup cache when it is enabled
+    def create_cached_llm_provider(
+        config: ExtractorConfig,
+        event_bus: EventBus,
+        markup_prompt_loader: MarkupPromptLoader,
+    ) -> LLMProviderPort:
+        from hci_extractor.providers.cached_provider import with_markup_cache
+
+        return with_markup_cache(
+            create_llm_provider(config, event_bus, markup_prompt_loader),
+            config.cache,
+            # Read the digest per request so reloaded prompts miss old entries
+            key_prefix=lambda: (
+                f"{config.analysis.model_name}:{markup_prompt_loader.prompts_digest}"
+            ),
+        )
+
+    # Register the configurable provider factory for the abstract interface.
+    # One shared provider keeps the Gemini client, and its HTTP connections,
+    # alive across requests instead of rebuilding them for every upload.
+    container.register_factory(
+        LLMProviderPort,
+        create_cached_llm_provider,
+        ServiceLifetime.SINGLETON,
+    )
 
     # Also register GeminiProvider specifically for backward compatibility
     def create_gemini_provider(
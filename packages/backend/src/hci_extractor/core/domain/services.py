@@ -70,17 +70,18 @@ class SectionAnalysisService:
             paper_id=paper_id,
             section_type=section_type,
         ) as metrics:
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             # Publish processing started event
-            self._event_bus.publish(
-                SectionProcessingStarted(
-                    paper_id=paper_id or "unknown",
-                    section_type=section_type,
-                    section_size_chars=len(section_text),
-                    chunk_count=1,  # Chunking not implemented in simple extractor
-                ),
-            )
+            if self._event_bus.has_subscribers(SectionProcessingStarted):
+                self._event_bus.publish(
+                    SectionProcessingStarted(
+                        paper_id=paper_id or "unknown",
+                        section_type=section_type,
+                        section_size_chars=len(section_text),
+                        chunk_count=1,  # Chunking not implemented in simple extractor
+                    ),
+                )
 
             try:
                 # Call provider for raw analysis
@@ -98,16 +99,17 @@ class SectionAnalysisService:
                 metrics.tokens_output = sum(len(str(e)) for e in cleaned_elements) // 4
 
                 # Publish completion event
-                duration = time.time() - start_time
-                self._event_bus.publish(
-                    SectionProcessingCompleted(
-                        paper_id=paper_id or "unknown",
-                        section_type=section_type,
-                        elements_extracted=len(cleaned_elements),
-                        duration_seconds=duration,
-                        tokens_used=metrics.tokens_input + metrics.tokens_output,
-                    ),
-                )
+                if self._event_bus.has_subscribers(SectionProcessingCompleted):
+                    duration = time.perf_counter() - start_time
+                    self._event_bus.publish(
+                        SectionProcessingCompleted(
+                            paper_id=paper_id or "unknown",
+                            section_type=section_type,
+                            elements_extracted=len(cleaned_elements),
+                            duration_seconds=duration,
+                            tokens_used=metrics.tokens_input + metrics.tokens_output,
+                        ),
+                    )
 
                 logger.info(
                     f"Analyzed {section_type} section: "
@@ -1,6 +1,6 @@
 """Domain validators for HCI extractor - pure business logic validation."""
 
-from typing import Any, Dict
+from typing import Any, ClassVar, Dict, FrozenSet, Tuple
 
 from hci_extractor.core.models.exceptions import (
     ElementFormatError,
@@ -18,14 +18,22 @@ class ElementValidator:
     """Validates extracted elements according to domain rules."""
 
     # Domain constants for valid values
-    VALID_ELEMENT_TYPES = frozenset(["goal", "method", "result"])
-    VALID_EVIDENCE_TYPES = frozenset(
+    VALID_ELEMENT_TYPES: ClassVar[FrozenSet[str]] = frozenset(
+        ["goal", "method", "result"],
+    )
+    VALID_EVIDENCE_TYPES: ClassVar[FrozenSet[str]] = frozenset(
         ["quantitative", "qualitative", "theoretical", "mixed", "unknown"],
     )
-    MIN_TEXT_LENGTH = 10
+    REQUIRED_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "element_type",
+        "text",
+        "evidence_type",
+        "confidence",
+    )
+    MIN_TEXT_LENGTH: ClassVar[int] = 10
 
     @classmethod
-    def validate_element(cls, element: Dict[str, Any], index: int) -> None:
+    def validate_element(cls, element: Any, index: int) -> None:
         """
         Validate a single element according to domain rules.
 
@@ -37,35 +45,38 @@ class ElementValidator:
             LLMValidationError: If validation fails
         """
         if not isinstance(element, dict):
-            raise ElementFormatError()
+            raise ElementFormatError(index=index, value=type(element).__name__)
 
         # Check required fields
-        required_fields = ["element_type", "text", "evidence_type", "confidence"]
-        for field in required_fields:
+        for field in cls.REQUIRED_FIELDS:
             if field not in element:
-                raise MissingRequiredFieldError()
+                raise MissingRequiredFieldError(index=index, value=field)
 
         # Validate element_type
-        if element["element_type"] not in cls.VALID_ELEMENT_TYPES:
-            raise InvalidElementTypeError()
+        element_type = element["element_type"]
+        if element_type not in cls.VALID_ELEMENT_TYPES:
+            raise InvalidElementTypeError(index=index, value=element_type)
 
         # Validate evidence_type
-        if element["evidence_type"] not in cls.VALID_EVIDENCE_TYPES:
-            raise InvalidEvidenceTypeError()
+        evidence_type = element["evidence_type"]
+        if evidence_type not in cls.VALID_EVIDENCE_TYPES:
+            raise InvalidEvidenceTypeError(index=index, value=evidence_type)
 
         # Validate confidence
-        if not isinstance(element["confidence"], (int, float)):
-            raise InvalidConfidenceError()
+        confidence = element["confidence"]
+        if not isinstance(confidence, (int, float)):
+            raise InvalidConfidenceError(index=index, value=confidence)
 
-        if not 0.0 <= element["confidence"] <= 1.0:
-            raise InvalidConfidenceError()
+        if not 0.0 <= confidence <= 1.0:
+            raise InvalidConfidenceError(index=index, value=confidence)
 
         # Validate text
-        if not isinstance(element["text"], str) or not element["text"].strip():
-            raise InvalidTextError()
+        text = element["text"]
+        if not isinstance(text, str) or not text.strip():
+            raise InvalidTextError(index=index)
 
     @classmethod
-    def validate_response(cls, response: Dict[str, Any]) -> None:
+    def validate_response(cls, response: Any) -> None:
         """
         Validate the complete LLM response structure.
 
@@ -101,14 +112,21 @@ class ElementValidator:
             True if element should be included, False otherwise
         """
         # Skip empty or very short extractions
-        return len(element.get("text", "")) >= cls.MIN_TEXT_LENGTH
+        text = element.get("text")
+        return text is not None and len(text) >= cls.MIN_TEXT_LENGTH
 
 
 class SummaryValidator:
     """Validates paper summary responses according to domain rules."""
 
+    REQUIRED_FIELDS: ClassVar[Tuple[str, ...]] = (
+        "summary",
+        "confidence",
+        "source_sections",
+    )
+
     @classmethod
-    def validate_summary(cls, response: Dict[str, Any]) -> None:
+    def validate_summary(cls, response: Any) -> None:
         """
         Validate paper summary response structure and content.
 
@@ -122,10 +140,9 @@ class SummaryValidator:
             raise ResponseFormatError()
 
         # Check required fields
-        required_fields = ["summary", "confidence", "source_sections"]
-        for field in required_fields:
+        for field in cls.REQUIRED_FIELDS:
             if field not in response:
-                raise MissingRequiredFieldError()
+                raise MissingRequiredFieldError(value=field)
 
         # Validate summary text
         if not isinstance(response["summary"], str):
@@ -317,9 +317,7 @@ class EventBus:
             event_type: The type of event to handle
             handler: The handler to call when the event is published
         """
-        if event_type not in self._handlers:
-            self._handlers[event_type] = ()
-        self._handlers[event_type] = self._handlers[event_type] + (handler,)
+        self._handlers[event_type] = (*self._handlers.get(event_type, ()), handler)
 
     def subscribe_all(self, handler: EventHandler) -> None:
         """
@@ -332,6 +330,20 @@ class EventBus:
         """
         self._global_handlers = (*self._global_handlers, handler)
 
+    def has_subscribers(self, event_type: Type[DomainEvent]) -> bool:
+        """
+        Check whether publishing an event type would reach any handler.
+
+        Lets publishers skip building events nobody is listening for.
+
+        Args:
+            event_type: The type of event to check
+
+        Returns:
+            True if a specific or global handler is registered
+        """
+        return bool(self._global_handlers) or bool(self._handlers.get(event_type))
+
     def publish(self, event: DomainEvent) -> None:
         """
         Publish an event to all registered handlers.
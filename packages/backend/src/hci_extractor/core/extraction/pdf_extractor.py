@@ -1,15 +1,19 @@
 """PDF text extraction with character-level positioning."""
 
 import logging
+import threading
+import time
 import types
+from array import array
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 
 import fitz  # PyMuPDF
 
 from hci_extractor.core.config import ExtractorConfig
 from hci_extractor.core.models import (
-    CharacterPosition,
+    CharacterPositions,
     PdfContent,
     PdfPage,
 )
@@ -25,6 +29,15 @@ from hci_extractor.core.models.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Resolved once; the library version cannot change within a process
+_PYMUPDF_VERSION = fitz.version[0]
+
+# PyMuPDF is not thread-safe; every call into it goes through this lock so
+# uploads extracted on worker threads never touch the library concurrently.
+# It is held per call rather than across yields, so page iterators can be
+# interleaved or discarded on any thread without deadlocking.
+_PYMUPDF_LOCK = threading.Lock()
+
 
 class PdfExtractor:
     """Extract text from PDFs with character-level positioning."""
@@ -37,19 +50,72 @@ class PdfExtractor:
         """
         self.config = config
         self.min_text_length = 100  # Minimum text length to consider valid
+        # Pages below this length skip character positioning (covers, scans)
+        self.min_page_text_length = 20
 
     def extract_content(self, file_path: Path) -> PdfContent:
         """Extract complete PDF content with positioning data."""
         logger.info(f"Starting extraction for {file_path}")
 
+        extraction_start = datetime.now()
+        timer_start = time.perf_counter()
+        pages = tuple(self.iter_pages(file_path))
+
+        if not pages:
+            raise ExtractionQualityError()
+
+        # Check overall text quality
+        total_text = "\n".join([page.text for page in pages])
+        if len(total_text.strip()) < self.min_text_length:
+            raise NoTextLayerError()
+
+        extraction_time = time.perf_counter() - timer_start
+
+        metadata = {
+            "extraction_time_seconds": extraction_time,
+            "file_size_bytes": file_path.stat().st_size,
+            "pymupdf_version": _PYMUPDF_VERSION,
+            "total_chars": len(total_text),
+        }
+
+        content = PdfContent(
+            file_path=str(file_path),
+            total_pages=len(pages),
+            pages=pages,
+            extraction_metadata=types.MappingProxyType(metadata),
+            created_at=extraction_start,
+        )
+
+        logger.info(
+            f"Successfully extracted {len(pages)} pages, "
+            f"{len(total_text)} chars in {extraction_time:.2f}s",
+        )
+
+        return content
+
+    def iter_pages(self, file_path: Path) -> Iterator[PdfPage]:
+        """Yield pages one at a time instead of materializing the whole document.
+
+        The path is validated eagerly so missing or non-PDF files fail at call
+        time. The document is only opened once iteration starts and is closed
+        when the iterator is exhausted, closed or discarded, so an iterator
+        that is never advanced holds no resources.
+        """
+        self._validate_path(file_path)
+        return self._generate_pages(file_path)
+
+    def _validate_path(self, file_path: Path) -> None:
+        """Check that the path exists and names a PDF file."""
         if not file_path.exists():
             raise FileNotFoundError()
 
         if not file_path.suffix.lower() == ".pdf":
             raise InvalidFileTypeError()
 
+    def _open_document(self, file_path: Path) -> fitz.Document:
+        """Open the path as a PyMuPDF document."""
         try:
-            doc = fitz.open(str(file_path))
+            return fitz.open(str(file_path))
         except fitz.FileDataError as e:
             if "password" in str(e).lower():
                 raise PasswordProtectedError()
@@ -57,49 +123,19 @@ class PdfExtractor:
         except Exception as e:
             raise PdfError() from e
 
+    def _generate_pages(self, file_path: Path) -> Iterator[PdfPage]:
+        """Open the document on first use and extract pages lazily."""
+        with _PYMUPDF_LOCK:
+            doc = self._open_document(file_path)
+            page_count = len(doc)
         try:
-            pages = []
-            extraction_start = datetime.now()
-
-            for page_num in range(len(doc)):
-                page = doc[page_num]
-                pdf_page = self._extract_page(page, page_num + 1)
-                pages.append(pdf_page)
-
-            if not pages:
-                raise ExtractionQualityError()
-
-            # Check overall text quality
-            total_text = "\n".join(page.text for page in pages)
-            if len(total_text.strip()) < self.min_text_length:
-                raise NoTextLayerError()
-
-            extraction_time = (datetime.now() - extraction_start).total_seconds()
-
-            metadata = {
-                "extraction_time_seconds": extraction_time,
-                "file_size_bytes": file_path.stat().st_size,
-                "pymupdf_version": fitz.version[0],
-                "total_chars": len(total_text),
-            }
-
-            content = PdfContent(
-                file_path=str(file_path),
-                total_pages=len(pages),
-                pages=tuple(pages),
-                extraction_metadata=types.MappingProxyType(metadata),
-                created_at=extraction_start,
-            )
-
-            logger.info(
-                f"Successfully extracted {len(pages)} pages, "
-                f"{len(total_text)} chars in {extraction_time:.2f}s",
-            )
-
-            return content
-
+            for page_num in range(page_count):
+                with _PYMUPDF_LOCK:
+                    page = self._extract_page(doc[page_num], page_num + 1)
+                yield page
         finally:
-            doc.close()
+            with _PYMUPDF_LOCK:
+                doc.close()
 
     def _extract_page(self, page: fitz.Page, page_num: int) -> PdfPage:
         """Extract single page with character positions."""
@@ -107,13 +143,25 @@ class PdfExtractor:
         rect = page.rect
         dimensions = (rect.width, rect.height)
 
+        # Cheap plain-text probe before the expensive dict traversal
+        quick_text = page.get_text("text")
+        if len(quick_text.strip()) < self.min_page_text_length:
+            return PdfPage(
+                page_number=page_num,
+                text=quick_text,
+                char_count=len(quick_text),
+                dimensions=dimensions,
+                char_positions=CharacterPositions(page_number=page_num),
+            )
+
         # Extract text with detailed positioning
         text_dict = page.get_text("dict")
 
-        # Build text and character positions
+        # Build text and character position columns
         page_text = ""
-        char_positions = []
-        char_index = 0
+        xs = array("d")
+        ys = array("d")
+        boxes = array("d")
 
         for block in text_dict["blocks"]:
             if "lines" not in block:  # Skip image blocks
@@ -123,45 +171,36 @@ class PdfExtractor:
                 for span in line["spans"]:
                     span_text = span["text"]
                     span_bbox = span["bbox"]
+                    span_len = len(span_text)
 
-                    # Add character positions for this span
-                    for i, _char in enumerate(span_text):
-                        # Approximate character position within span
-                        char_x = span_bbox[0] + (i / len(span_text)) * (
-                            span_bbox[2] - span_bbox[0]
-                        )
-                        char_pos = CharacterPosition(
-                            char_index=char_index,
-                            page_number=page_num,
-                            x=char_x,
-                            y=span_bbox[1],
-                            bbox=span_bbox,
-                        )
-                        char_positions.append(char_pos)
-                        char_index += 1
+                    # Approximate character positions evenly across the span
+                    x0 = span_bbox[0]
+                    width = span_bbox[2] - x0
+                    xs.extend([x0 + (i / span_len) * width for i in range(span_len)])
+                    ys.extend(array("d", (span_bbox[1],)) * span_len)
+                    boxes.extend(array("d", span_bbox) * span_len)
 
                     page_text += span_text
 
                 # Add line break
                 if page_text and not page_text.endswith("\n"):
                     page_text += "\n"
-                    char_positions.append(
-                        CharacterPosition(
-                            char_index=char_index,
-                            page_number=page_num,
-                            x=0,
-                            y=line["bbox"][3],
-                            bbox=(0, line["bbox"][3], 0, line["bbox"][3]),
-                        ),
-                    )
-                    char_index += 1
+                    line_bottom = line["bbox"][3]
+                    xs.append(0.0)
+                    ys.append(line_bottom)
+                    boxes.extend((0.0, line_bottom, 0.0, line_bottom))
 
         return PdfPage(
             page_number=page_num,
             text=page_text,
             char_count=len(page_text),
             dimensions=dimensions,
-            char_positions=tuple(char_positions),
+            char_positions=CharacterPositions(
+                page_number=page_num,
+                x=xs,
+                y=ys,
+                bbox=boxes,
+            ),
         )
 
     def validate_extraction(self, content: PdfContent) -> bool:
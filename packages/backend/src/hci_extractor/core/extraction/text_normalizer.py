@@ -1,11 +1,93 @@
 """Text normalization with reversible transformations for academic content."""
 
 import re
-import types
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from functools import lru_cache
 from typing import List, Tuple
 
 from hci_extractor.core.models import TextTransformation
 
+# Pattern: word- \n word -> word word
+_HYPHEN_RE = re.compile(r"(\w+)-\s*\n\s*(\w+)")
+
+# Whitespace runs that normalization rewrites; single spaces are left alone
+_WHITESPACE_RE = re.compile(r"( {2,})|(\n{2,})|(\n)")
+
+# Lines with just roman numerals (matched against lowercased text)
+_ROMAN_RE = re.compile(r"^[ivxlcdm]+$")
+
+# Lines that are just journal names or copyright
+_COPYRIGHT_RE = re.compile(
+    "|".join(
+        [
+            r"copyright",
+            r"©\s*\d{4}",
+            r"all rights reserved",
+            r"acm\s+digital\s+library",
+            r"doi:",
+        ],
+    ),
+    re.IGNORECASE,
+)
+
+
+class _SegmentMap:
+    """Run-length map from text positions back to original positions.
+
+    Segment ``k`` maps ``lengths[k]`` consecutive characters from ``starts[k]``
+    to consecutive original positions from ``origins[k]``; an origin of -1
+    marks inserted characters. Columns are packed machine-int arrays rather
+    than lists of tuples, so long papers cost 24 bytes per segment.
+    """
+
+    def __init__(self) -> None:
+        self._starts = array("q")
+        self._origins = array("q")
+        self._lengths = array("q")
+        self._length = 0
+
+    @classmethod
+    def identity(cls, length: int) -> "_SegmentMap":
+        """Map every position of a ``length``-character text to itself."""
+        segment_map = cls()
+        segment_map.append(0, length)
+        return segment_map
+
+    def __len__(self) -> int:
+        return self._length
+
+    def append(self, orig_start: int, length: int = 1) -> None:
+        """Map the next ``length`` characters to originals from ``orig_start``."""
+        if length <= 0:
+            return
+        if self._origins:
+            last_orig = self._origins[-1]
+            if last_orig != -1 and orig_start == last_orig + self._lengths[-1]:
+                self._lengths[-1] += length
+                self._length += length
+                return
+        self._starts.append(self._length)
+        self._origins.append(orig_start)
+        self._lengths.append(length)
+        self._length += length
+
+    def extend_from(self, other: "_SegmentMap", start: int, end: int) -> None:
+        """Append the mapping of ``other``'s positions ``start:end``."""
+        index = bisect_right(other._starts, start) - 1
+        while start < end:
+            offset = start - other._starts[index]
+            orig_start = other._origins[index]
+            take = min(other._lengths[index] - offset, end - start)
+            self.append(-1 if orig_start == -1 else orig_start + offset, take)
+            start += take
+            index += 1
+
+    def to_segments(self) -> Tuple[Tuple[int, int, int], ...]:
+        """Return the segments as ``(new_start, orig_start, length)`` tuples."""
+        return tuple(zip(self._starts, self._origins, self._lengths))
+
 
 class TextNormalizer:
     """Clean PDF text while maintaining verbatim validation capability."""
@@ -19,14 +101,24 @@ class TextNormalizer:
             r"\([^)]*[0-9]{4}[^)]*\)",  # (Author, 2023)
         ]
 
-        # Mathematical notation to preserve
+        # Mathematical notation to preserve, as one character class so a run of
+        # symbols is a single match rather than one alternation hit per char
         self.math_patterns = [
-            r"[α-ωΑ-Ω]",  # Greek letters
-            r"[≤≥≠≈±∑∏∫∂∇]",  # Math symbols
-            r"[₀₁₂₃₄₅₆₇₈₉]",  # Subscripts
-            r"[⁰¹²³⁴⁵⁶⁷⁸⁹]",  # Superscripts
+            (
+                "["
+                "α-ωΑ-Ω"  # Greek letters
+                "≤≥≠≈±∑∏∫∂∇"  # Math symbols
+                "₀₁₂₃₄₅₆₇₈₉"  # Subscripts
+                "⁰¹²³⁴⁵⁶⁷⁸⁹"  # Superscripts
+                "]+"
+            ),
         ]
 
+        # Single alternation so protected spans are found in one left-to-right scan
+        self._protect_re = re.compile(
+            "|".join(f"(?:{p})" for p in self.citation_patterns + self.math_patterns),
+        )
+
     def normalize(self, raw_text: str) -> TextTransformation:
         """Apply cleaning transformations while maintaining verbatim traceability."""
         if not raw_text:
@@ -34,15 +126,13 @@ class TextNormalizer:
                 original_text=raw_text,
                 cleaned_text=raw_text,
                 transformations=(),
-                char_mapping=types.MappingProxyType({}),
             )
 
         transformations: List[str] = []
-        char_mapping = {}
         current_text = raw_text
 
         # Track original positions through transformations
-        position_map = list(range(len(raw_text)))
+        position_map = _SegmentMap.identity(len(raw_text))
 
         # 1. Fix hyphenated words
         current_text, position_map = self._fix_hyphenation(
@@ -65,39 +155,35 @@ class TextNormalizer:
             transformations,
         )
 
-        # Build final character mapping
-        for i, orig_pos in enumerate(position_map):
-            if orig_pos != -1:  # -1 indicates deleted character
-                char_mapping[i] = orig_pos
-
         return TextTransformation(
             original_text=raw_text,
             cleaned_text=current_text,
             transformations=tuple(transformations),
-            char_mapping=types.MappingProxyType(char_mapping),
+            segments=position_map.to_segments(),
         )
 
     def _fix_hyphenation(
         self,
         text: str,
-        position_map: List[int],
+        position_map: _SegmentMap,
         transformations: List[str],
-    ) -> Tuple[str, List[int]]:
+    ) -> Tuple[str, _SegmentMap]:
         """Fix hyphenated words split across lines."""
-        # Pattern: word- \n word -> word word
-        pattern = r"(\w+)-\s*\n\s*(\w+)"
+        # A join needs both a hyphen and a line break
+        if "-" not in text or "\n" not in text:
+            return text, position_map
 
         def replace_hyphen(match: re.Match[str]) -> str:
             return f"{match.group(1)}{match.group(2)}"
 
         new_text = ""
-        new_position_map = []
+        new_position_map = _SegmentMap()
         last_end = 0
 
-        for match in re.finditer(pattern, text):
+        for match in _HYPHEN_RE.finditer(text):
             # Add text before match
             new_text += text[last_end : match.start()]
-            new_position_map.extend(position_map[last_end : match.start()])
+            new_position_map.extend_from(position_map, last_end, match.start())
 
             # Add the dehyphenated word
             replacement = replace_hyphen(match)
@@ -110,15 +196,15 @@ class TextNormalizer:
             word2_start = match.end() - len(match.group(2))
 
             # Add positions for first word
-            new_position_map.extend(position_map[match.start() : word1_end])
+            new_position_map.extend_from(position_map, match.start(), word1_end)
             # Add positions for second word
-            new_position_map.extend(position_map[word2_start : match.end()])
+            new_position_map.extend_from(position_map, word2_start, match.end())
 
             last_end = match.end()
 
         # Add remaining text
         new_text += text[last_end:]
-        new_position_map.extend(position_map[last_end:])
+        new_position_map.extend_from(position_map, last_end, len(text))
 
         if len(new_text) != len(text):
             transformations.append("fix_hyphenation")
@@ -128,137 +214,82 @@ class TextNormalizer:
     def _normalize_whitespace(
         self,
         text: str,
-        position_map: List[int],
+        position_map: _SegmentMap,
         transformations: List[str],
-    ) -> Tuple[str, List[int]]:
+    ) -> Tuple[str, _SegmentMap]:
         """Normalize excessive whitespace while preserving structure."""
         # Replace multiple spaces with single space
         # But preserve paragraph breaks (double newlines)
+        if "  " not in text and "\n" not in text:
+            return text, position_map
 
-        # First preserve important whitespace patterns
-        protected_ranges = []
-
-        # Protect citations and math
-        all_patterns = self.citation_patterns + self.math_patterns
-        for pattern in all_patterns:
-            for match in re.finditer(pattern, text):
-                protected_ranges.append((match.start(), match.end()))
-
-        # Sort and merge overlapping ranges
-        protected_ranges.sort()
-        merged_ranges: List[Tuple[int, int]] = []
-        for start, end in protected_ranges:
-            if merged_ranges and start <= merged_ranges[-1][1]:
-                merged_ranges[-1] = (
-                    merged_ranges[-1][0],
-                    max(merged_ranges[-1][1], end),
-                )
+        # Citations and math are copied verbatim. Protected spans begin and end
+        # on non-whitespace, so each whitespace run lies wholly inside one span
+        # or wholly outside all of them; both scans run once, left to right.
+        past_end = (len(text) + 1, len(text) + 1)
+        protected_spans = (match.span() for match in self._protect_re.finditer(text))
+        protected_start, protected_end = next(protected_spans, past_end)
+
+        parts: List[str] = []
+        new_position_map = _SegmentMap()
+        run_start = 0
+
+        for match in _WHITESPACE_RE.finditer(text):
+            ws_start = match.start()
+            while protected_end <= ws_start:
+                protected_start, protected_end = next(protected_spans, past_end)
+            if protected_start <= ws_start:
+                continue
+
+            spaces, paragraph_break, _newline = match.groups()
+            if spaces:
+                # Collapse multiple spaces: keep the first, skip the rest
+                parts.append(text[run_start : ws_start + 1])
+                new_position_map.extend_from(position_map, run_start, ws_start + 1)
             else:
-                merged_ranges.append((start, end))
-
-        new_text = ""
-        new_position_map = []
-        last_pos = 0
-
-        # Process text between protected ranges
-        for start, end in [*merged_ranges, (len(text), len(text))]:
-            if last_pos < start:
-                # Normalize whitespace in unprotected section
-                section = text[last_pos:start]
-                section_positions = position_map[last_pos:start]
-
-                normalized_section, normalized_positions = (
-                    self._normalize_section_whitespace(section, section_positions)
-                )
-
-                new_text += normalized_section
-                new_position_map.extend(normalized_positions)
-
-            if start < len(text):
-                # Add protected section as-is
-                new_text += text[start:end]
-                new_position_map.extend(position_map[start:end])
-                last_pos = end
-
-        if len(new_text) != len(text):
-            transformations.append("normalize_whitespace")
-
-        return new_text, new_position_map
-
-    def _normalize_section_whitespace(
-        self,
-        section: str,
-        positions: List[int],
-    ) -> Tuple[str, List[int]]:
-        """Normalize whitespace in a text section."""
-        # Multiple spaces -> single space
-        # Multiple newlines -> preserve paragraph breaks
-
-        result = ""
-        result_positions = []
-        i = 0
-
-        while i < len(section):
-            char = section[i]
-
-            if char == " ":
-                # Collapse multiple spaces
-                result += " "
-                result_positions.append(positions[i])
-                # Skip additional spaces
-                while i + 1 < len(section) and section[i + 1] == " ":
-                    i += 1
-            elif char == "\n":
-                # Handle newlines - preserve double newlines (paragraph breaks)
-                newline_count = 0
-                start_i = i
-                while i < len(section) and section[i] == "\n":
-                    newline_count += 1
-                    i += 1
-
-                if newline_count >= 2:
+                parts.append(text[run_start:ws_start])
+                new_position_map.extend_from(position_map, run_start, ws_start)
+                if paragraph_break:
                     # Preserve paragraph break
-                    result += "\n\n"
-                    result_positions.extend([positions[start_i], positions[start_i]])
+                    parts.append("\n\n")
+                    new_position_map.extend_from(position_map, ws_start, ws_start + 1)
+                    new_position_map.extend_from(position_map, ws_start, ws_start + 1)
                 else:
                     # Single newline -> space
-                    result += " "
-                    result_positions.append(positions[start_i])
+                    parts.append(" ")
+                    new_position_map.extend_from(position_map, ws_start, ws_start + 1)
+            run_start = match.end()
 
-                i -= 1  # Adjust for loop increment
-            else:
-                result += char
-                result_positions.append(positions[i])
+        parts.append(text[run_start:])
+        new_position_map.extend_from(position_map, run_start, len(text))
+        new_text = "".join(parts)
 
-            i += 1
+        if len(new_text) != len(text):
+            transformations.append("normalize_whitespace")
 
-        return result, result_positions
+        return new_text, new_position_map
 
     def _remove_headers_footers(
         self,
         text: str,
-        position_map: List[int],
+        position_map: _SegmentMap,
         transformations: List[str],
-    ) -> Tuple[str, List[int]]:
+    ) -> Tuple[str, _SegmentMap]:
         """Conservatively remove repetitive headers and footers."""
-        lines = text.split("\n")
-        line_positions = []
+        # A line must repeat at least three times to be removed
+        if text.count("\n") < 2:
+            return text, position_map
 
-        # Build line position mapping
-        current_pos = 0
-        for line in lines:
-            line_start = current_pos
-            line_end = current_pos + len(line)
-            line_positions.append((line_start, line_end))
-            current_pos = line_end + 1  # +1 for newline
+        lines = text.split("\n")
+        stripped_lines = [line.strip() for line in lines]
 
         # Identify potential headers/footers (conservative approach)
         # Look for lines that appear multiple times and are short
-        line_counts: dict[str, int] = {}
-        for line in lines:
-            stripped = line.strip()
-            if stripped and len(stripped) < 100:  # Only consider short lines
-                line_counts[stripped] = line_counts.get(stripped, 0) + 1
+        line_counts = Counter(
+            stripped
+            for stripped in stripped_lines
+            if stripped and len(stripped) < 100  # Only consider short lines
+        )
 
         # Find lines that appear 3+ times (likely headers/footers)
         repetitive_lines = {
@@ -272,24 +303,31 @@ class TextNormalizer:
 
         # Remove repetitive lines
         new_text = ""
-        new_position_map = []
+        new_position_map = _SegmentMap()
+        line_start = 0  # Offset of the current line in text
 
-        for i, line in enumerate(lines):
-            if line.strip() not in repetitive_lines:
+        for line, stripped in zip(lines, stripped_lines):
+            line_end = line_start + len(line)
+            if stripped not in repetitive_lines:
                 if new_text:
                     new_text += "\n"
                     new_position_map.append(-1)  # Mark newline as inserted
                 new_text += line
-                start_pos, end_pos = line_positions[i]
-                new_position_map.extend(position_map[start_pos:end_pos])
+                new_position_map.extend_from(position_map, line_start, line_end)
+            line_start = line_end + 1  # +1 for newline
 
         if len(new_text) != len(text):
             transformations.append("remove_headers_footers")
 
         return new_text, new_position_map
 
-    def _is_content_line(self, line: str) -> bool:
-        """Check if a line contains actual content vs header/footer."""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _is_content_line(line: str) -> bool:
+        """Check if a line contains actual content vs header/footer.
+
+        Cached per line: headers and footers repeat on every page.
+        """
         stripped = line.strip()
 
         # Skip empty lines
@@ -301,7 +339,7 @@ class TextNormalizer:
             return False
 
         # Lines with just roman numerals
-        if re.match(r"^[ivxlcdm]+$", stripped.lower()):
+        if _ROMAN_RE.match(stripped.lower()):
             return False
 
         # Very short lines without meaningful content
@@ -313,16 +351,4 @@ class TextNormalizer:
             return False
 
         # Lines that are just journal names or copyright
-        copyright_patterns = [
-            r"copyright",
-            r"©\s*\d{4}",
-            r"all rights reserved",
-            r"acm\s+digital\s+library",
-            r"doi:",
-        ]
-
-        for pattern in copyright_patterns:
-            if re.search(pattern, stripped.lower()):
-                return False
-
-        return True
+        return not _COPYRIGHT_RE.search(stripped)
@@ -6,13 +6,23 @@ system performance without adding mutable state to core components.
 """
 
 import time
-from collections import defaultdict
+from collections import Counter, defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Literal, Optional
 
+from hci_extractor.core._compat import _SLOTS
 
-@dataclass(frozen=True)
+# Estimated cost per 1k tokens (example rates, adjust for actual providers)
+_COST_PER_1K_TOKENS: Dict[str, float] = {
+    "gemini-1.5-flash": 0.000075,
+    "gpt-4": 0.03,
+    "claude-3": 0.025,
+}
+_DEFAULT_COST_PER_1K_TOKENS = 0.01
+
+
+@dataclass(frozen=True, **_SLOTS)
 class LLMUsageMetric:
     """Immutable record of a single LLM API usage."""
 
@@ -30,7 +40,7 @@ class LLMUsageMetric:
     section_type: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class ExtractionMetric:
     """Immutable record of a PDF extraction operation."""
 
@@ -47,7 +57,7 @@ class ExtractionMetric:
     error_type: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class MetricsSummary:
     """Immutable summary of collected metrics."""
 
@@ -69,17 +79,43 @@ class MetricsCollector:
     Collects metrics without polluting provider implementations.
 
     This collector maintains internal state but provides immutable
-    views of the metrics data.
+    views of the metrics data. LLM usage is folded into running totals
+    as it is recorded, so summaries cost the same however many calls
+    have been made.
     """
 
     def __init__(self) -> None:
-        self._llm_metrics: tuple[LLMUsageMetric, ...] = ()
         self._extraction_metrics: tuple[ExtractionMetric, ...] = ()
         self._start_time = datetime.now(timezone.utc)
+        self._reset_llm_totals()
+
+    def _reset_llm_totals(self) -> None:
+        """Zero the running LLM usage aggregates."""
+        self._llm_requests = 0
+        self._llm_successful = 0
+        self._llm_tokens = 0
+        self._llm_cost = 0.0
+        self._llm_response_time = 0.0
+        self._requests_by_provider: Counter[str] = Counter()
+        self._tokens_by_provider: Counter[str] = Counter()
+        self._errors_by_type: Counter[str] = Counter()
 
     def record_llm_usage(self, metric: LLMUsageMetric) -> None:
         """Record a new LLM usage metric."""
-        self._llm_metrics = (*self._llm_metrics, metric)
+        self._llm_requests += 1
+        if metric.success:
+            self._llm_successful += 1
+        self._llm_tokens += metric.tokens_total
+        self._llm_cost += (
+            metric.tokens_total
+            / 1000
+            * _COST_PER_1K_TOKENS.get(metric.model, _DEFAULT_COST_PER_1K_TOKENS)
+        )
+        self._llm_response_time += metric.response_time_seconds
+        self._requests_by_provider[metric.provider] += 1
+        self._tokens_by_provider[metric.provider] += metric.tokens_total
+        if metric.error_type:
+            self._errors_by_type[metric.error_type] += 1
 
     def record_extraction(self, metric: ExtractionMetric) -> None:
         """Record a new extraction metric."""
@@ -87,58 +123,21 @@ class MetricsCollector:
 
     def get_llm_summary(self) -> MetricsSummary:
         """Get an immutable summary of LLM usage metrics."""
-        if not self._llm_metrics:
+        if not self._llm_requests:
             return self._empty_summary()
 
-        total_requests = len(self._llm_metrics)
-        successful = sum(1 for m in self._llm_metrics if m.success)
-        failed = total_requests - successful
-
-        total_tokens = sum(m.tokens_total for m in self._llm_metrics)
-
-        # Estimate costs (example rates, adjust for actual providers)
-        cost_per_1k_tokens = {
-            "gemini-1.5-flash": 0.000075,
-            "gpt-4": 0.03,
-            "claude-3": 0.025,
-        }
-
-        total_cost = sum(
-            m.tokens_total / 1000 * cost_per_1k_tokens.get(m.model, 0.01)
-            for m in self._llm_metrics
-        )
-
-        avg_response_time = (
-            sum(m.response_time_seconds for m in self._llm_metrics) / total_requests
-            if total_requests > 0
-            else 0.0
-        )
-
-        # Group by provider
-        requests_by_provider: defaultdict[str, int] = defaultdict(int)
-        tokens_by_provider: defaultdict[str, int] = defaultdict(int)
-        for metric in self._llm_metrics:
-            requests_by_provider[metric.provider] += 1
-            tokens_by_provider[metric.provider] += metric.tokens_total
-
-        # Group errors
-        errors_by_type: defaultdict[str, int] = defaultdict(int)
-        for metric in self._llm_metrics:
-            if metric.error_type:
-                errors_by_type[metric.error_type] += 1
-
         return MetricsSummary(
             period_start=self._start_time,
             period_end=datetime.now(timezone.utc),
-            total_requests=total_requests,
-            successful_requests=successful,
-            failed_requests=failed,
-            total_tokens=total_tokens,
-            total_cost_estimate=total_cost,
-            average_response_time=avg_response_time,
-            requests_by_provider=dict(requests_by_provider),
-            tokens_by_provider=dict(tokens_by_provider),
-            errors_by_type=dict(errors_by_type),
+            total_requests=self._llm_requests,
+            successful_requests=self._llm_successful,
+            failed_requests=self._llm_requests - self._llm_successful,
+            total_tokens=self._llm_tokens,
+            total_cost_estimate=self._llm_cost,
+            average_response_time=self._llm_response_time / self._llm_requests,
+            requests_by_provider=dict(self._requests_by_provider),
+            tokens_by_provider=dict(self._tokens_by_provider),
+            errors_by_type=dict(self._errors_by_type),
         )
 
     def get_extraction_summary(self) -> Dict[str, Any]:
@@ -200,9 +199,9 @@ class MetricsCollector:
 
     def clear(self) -> None:
         """Clear all collected metrics."""
-        self._llm_metrics = ()
         self._extraction_metrics = ()
         self._start_time = datetime.now(timezone.utc)
+        self._reset_llm_totals()
 
 
 # Note: Global metrics collector removed - use dependency injection
@@ -233,11 +232,11 @@ class LLMMetricsContext:
         self.tokens_output = 0
 
     def __enter__(self) -> "LLMMetricsContext":
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         return self
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> Literal[False]:
-        duration = time.time() - (self.start_time or 0)
+        duration = time.perf_counter() - (self.start_time or 0)
         success = exc_type is None
         error_type = exc_type.__name__ if exc_type else None
 
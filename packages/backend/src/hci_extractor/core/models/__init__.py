@@ -22,6 +22,7 @@ from .exceptions import (
 )
 from .pdf_models import (
     CharacterPosition,
+    CharacterPositions,
     DetectedSection,
     ExtractedElement,
     ExtractionResult,
@@ -35,6 +36,7 @@ __all__ = [
     "ApiKeyError",
     # PDF Models
     "CharacterPosition",
+    "CharacterPositions",
     "ConfigurationError",
     "ContentFilterError",
     "CorruptedFileError",
@@ -4,7 +4,7 @@ This module provides a consistent exception hierarchy for all components
 of the HCI extractor system, replacing fragmented exception patterns.
 """
 
-from typing import Optional
+from typing import Any, Optional
 
 
 class HciExtractorError(Exception):
@@ -122,52 +122,102 @@ class LLMValidationError(LLMError):
 
 # Element Validation Exceptions
 class ElementValidationError(LLMValidationError):
-    """Element validation failed."""
+    """Element validation failed.
 
-    def __init__(self, message: str = "Element validation failed"):
+    The offending element index and value are kept as raw attributes and
+    only formatted into the message when the exception is rendered, so
+    raising on the validation path does no string work.
+    """
+
+    def __init__(
+        self,
+        message: str = "Element validation failed",
+        index: Optional[int] = None,
+        value: Any = None,
+    ):
         super().__init__(message)
+        self.index = index
+        self.value = value
+
+    def __str__(self) -> str:
+        message = super().__str__()
+        if self.index is not None:
+            message = f"{message} at element {self.index}"
+        if self.value is not None:
+            message = f"{message}: {self.value!r}"
+        return message
 
 
 class ElementFormatError(ElementValidationError):
     """Element format is invalid."""
 
-    def __init__(self, message: str = "Invalid element format"):
-        super().__init__(message)
+    def __init__(
+        self,
+        message: str = "Invalid element format",
+        index: Optional[int] = None,
+        value: Any = None,
+    ):
+        super().__init__(message, index, value)
 
 
 class MissingRequiredFieldError(ElementValidationError):
     """Required field is missing."""
 
-    def __init__(self, message: str = "Missing required field"):
-        super().__init__(message)
+    def __init__(
+        self,
+        message: str = "Missing required field",
+        index: Optional[int] = None,
+        value: Any = None,
+    ):
+        super().__init__(message, index, value)
 
 
 class InvalidElementTypeError(ElementValidationError):
     """Element type is invalid."""
 
-    def __init__(self, message: str = "Invalid element type"):
-        super().__init__(message)
+    def __init__(
+        self,
+        message: str = "Invalid element type",
+        index: Optional[int] = None,
+        value: Any = None,
+    ):
+        super().__init__(message, index, value)
 
 
 class InvalidEvidenceTypeError(ElementValidationError):
     """Evidence type is invalid."""
 
-    def __init__(self, message: str = "Invalid evidence type"):
-        super().__init__(message)
+    def __init__(
+        self,
+        message: str = "Invalid evidence type",
+        index: Optional[int] = None,
+        value: Any = None,
+    ):
+        super().__init__(message, index, value)
 
 
 class InvalidConfidenceError(ElementValidationError):
     """Confidence value is invalid."""
 
-    def __init__(self, message: str = "Invalid confidence value"):
-        super().__init__(message)
+    def __init__(
+        self,
+        message: str = "Invalid confidence value",
+        index: Optional[int] = None,
+        value: Any = None,
+    ):
+        super().__init__(message, index, value)
 
 
 class InvalidTextError(ElementValidationError):
     """Text field is invalid."""
 
-    def __init__(self, message: str = "Invalid text field"):
-        super().__init__(message)
+    def __init__(
+        self,
+        message: str = "Invalid text field",
+        index: Optional[int] = None,
+        value: Any = None,
+    ):
+        super().__init__(message, index, value)
 
 
 # Response Validation Exceptions
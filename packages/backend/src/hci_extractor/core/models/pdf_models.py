@@ -1,11 +1,27 @@
 """Immutable data models for PDF content extraction."""
 
+import os
+import sys
 import types
 import uuid
+from array import array
+from bisect import bisect_right
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, Literal, Optional, Union
+from itertools import accumulate, count
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Iterator,
+    Literal,
+    NamedTuple,
+    Optional,
+    Union,
+)
 
+from hci_extractor.core._compat import _SLOTS
 from hci_extractor.core.models.exceptions import (
     InvalidBoundingBox,
     InvalidCharacterPosition,
@@ -16,8 +32,37 @@ from hci_extractor.core.models.exceptions import (
     TextLengthMismatch,
 )
 
+# Nothing can reach the dict behind this proxy, so one instance is shared
+# as the default instead of allocating a fresh one per model
+_EMPTY_METADATA: types.MappingProxyType[str, Any] = types.MappingProxyType({})
+
+
+class _IdGenerator:
+    """Generate UUID4-formatted identifiers without a urandom read per call.
+
+    One random UUID is drawn per process; identifiers keep its first 80 bits
+    and count up through the last 48, so version and variant bits stay valid.
+    """
+
+    def __init__(self) -> None:
+        self._reseed()
+
+    def _reseed(self) -> None:
+        value = uuid.uuid4().hex
+        self._prefix = f"{value[:8]}-{value[8:12]}-{value[12:16]}-{value[16:20]}-"
+        self._counter = count(int(value[20:], 16))
+
+    def __call__(self) -> str:
+        return f"{self._prefix}{next(self._counter) & 0xFFFFFFFFFFFF:012x}"
 
-@dataclass(frozen=True)
+
+_new_id = _IdGenerator()
+if hasattr(os, "register_at_fork"):
+    # Forked children would otherwise repeat the parent's sequence
+    os.register_at_fork(after_in_child=_new_id._reseed)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class CharacterPosition:
     """Character-level positioning for verbatim validation."""
 
@@ -37,15 +82,74 @@ class CharacterPosition:
             raise InvalidBoundingBox()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
+class CharacterPositions:
+    """Column-wise character positions for one page.
+
+    Stores coordinates in packed float arrays instead of one object per
+    character; ``bbox`` holds four values per character. Indexing builds a
+    ``CharacterPosition`` view on demand.
+
+    The columns are either empty or hold one entry per character of the
+    page text. Near-empty pages (covers, scans) are extracted without
+    positions, so check ``len()`` before indexing.
+    """
+
+    page_number: int = 1
+    x: "array[float]" = field(default_factory=lambda: array("d"))
+    y: "array[float]" = field(default_factory=lambda: array("d"))
+    bbox: "array[float]" = field(default_factory=lambda: array("d"))
+
+    def __post_init__(self) -> None:
+        """Validate that the columns line up."""
+        if self.page_number < 1:
+            raise InvalidPageNumber()
+        if len(self.y) != len(self.x):
+            raise InvalidCharacterPosition()
+        if len(self.bbox) != 4 * len(self.x):
+            raise InvalidBoundingBox()
+
+    def __hash__(self) -> int:
+        # array.array is unhashable; hash the column values instead so pages
+        # and documents stay hashable like the frozen records they are
+        return hash((self.page_number, tuple(self.x), tuple(self.y), tuple(self.bbox)))
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __getitem__(self, index: int) -> CharacterPosition:
+        """Return the position of the character at page-local ``index``."""
+        if index < 0:
+            index += len(self.x)
+        if not 0 <= index < len(self.x):
+            raise IndexError("character index out of range")
+        box = self.bbox[4 * index : 4 * index + 4]
+        return CharacterPosition(
+            char_index=index,
+            page_number=self.page_number,
+            x=self.x[index],
+            y=self.y[index],
+            bbox=(box[0], box[1], box[2], box[3]),
+        )
+
+    def __iter__(self) -> Iterator[CharacterPosition]:
+        return (self[index] for index in range(len(self.x)))
+
+
+@dataclass(frozen=True, **_SLOTS)
 class PdfPage:
-    """Immutable representation of a single PDF page."""
+    """Immutable representation of a single PDF page.
+
+    ``char_positions`` covers every character of ``text``, except on pages
+    whose text is too short to be worth positioning. Those pages carry an
+    empty ``CharacterPositions`` for the same page number.
+    """
 
     page_number: int
     text: str
     char_count: int
     dimensions: tuple[float, float]  # width, height
-    char_positions: tuple[CharacterPosition, ...] = ()
+    char_positions: CharacterPositions = field(default_factory=CharacterPositions)
 
     def __post_init__(self) -> None:
         """Validate page data integrity."""
@@ -59,7 +163,7 @@ class PdfPage:
             raise InvalidDimensions()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class PdfContent:
     """Immutable representation of complete PDF document."""
 
@@ -67,9 +171,22 @@ class PdfContent:
     total_pages: int
     pages: tuple[PdfPage, ...]
     extraction_metadata: types.MappingProxyType[str, Any] = field(
-        default_factory=lambda: types.MappingProxyType({}),
+        default_factory=lambda: _EMPTY_METADATA,
     )
     created_at: datetime = field(default_factory=datetime.now)
+    # Derived values, filled on first use
+    _full_text: Optional[str] = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+    _page_ends: Optional[tuple[int, ...]] = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     def __post_init__(self) -> None:
         """Validate PDF content integrity."""
@@ -83,42 +200,58 @@ class PdfContent:
     @property
     def full_text(self) -> str:
         """Return complete text content across all pages."""
-        return "\n".join(page.text for page in self.pages)
+        full_text = self._full_text
+        if full_text is None:
+            full_text = "\n".join([page.text for page in self.pages])
+            object.__setattr__(self, "_full_text", full_text)
+        return full_text
 
     @property
     def total_chars(self) -> int:
         """Return total character count across all pages."""
-        return sum(page.char_count for page in self.pages)
+        page_ends = self._page_end_offsets()
+        return page_ends[-1] if page_ends else 0
 
     def get_text_at_position(self, char_index: int) -> tuple[str, int]:
         """Return character and page number at global character index."""
-        if char_index < 0 or char_index >= self.total_chars:
+        page_ends = self._page_end_offsets()
+        if char_index < 0 or not page_ends or char_index >= page_ends[-1]:
             raise InvalidCharacterPosition()
 
-        current_index = 0
-        for page in self.pages:
-            if current_index + page.char_count > char_index:
-                local_index = char_index - current_index
-                return page.text[local_index], page.page_number
-            current_index += page.char_count
+        page_index = bisect_right(page_ends, char_index)
+        page_start = page_ends[page_index - 1] if page_index else 0
+        page = self.pages[page_index]
+        return page.text[char_index - page_start], page.page_number
 
-        raise InvalidCharacterPosition()
+    def _page_end_offsets(self) -> tuple[int, ...]:
+        """Return cumulative character counts per page, computed once."""
+        page_ends = self._page_ends
+        if page_ends is None:
+            page_ends = tuple(accumulate(page.char_count for page in self.pages))
+            object.__setattr__(self, "_page_ends", page_ends)
+        return page_ends
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class TextTransformation:
     """Track text cleaning transformations for reversibility."""
 
     original_text: str
     cleaned_text: str
     transformations: tuple[str, ...] = ()
-    char_mapping: types.MappingProxyType[int, int] = field(
-        default_factory=lambda: types.MappingProxyType({}),
-    )
+    # (cleaned_start, original_start, length) runs in cleaned-text order;
+    # an original_start of -1 marks inserted characters
+    segments: tuple[tuple[int, int, int], ...] = ()
 
     def reverse_lookup(self, cleaned_position: int) -> int:
         """Map cleaned text position back to original."""
-        return self.char_mapping.get(cleaned_position, -1)
+        index = bisect_right(self.segments, (cleaned_position, sys.maxsize)) - 1
+        if index < 0:
+            return -1
+        start, original_start, length = self.segments[index]
+        if original_start == -1 or cleaned_position >= start + length:
+            return -1
+        return original_start + cleaned_position - start
 
     def __post_init__(self) -> None:
         """Validate transformation data."""
@@ -126,7 +259,7 @@ class TextTransformation:
             raise InvalidElementData()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class DetectedSection:
     """Immutable representation of a detected paper section."""
 
@@ -173,7 +306,7 @@ class DetectedSection:
     ) -> "DetectedSection":
         """Create a DetectedSection with automatically generated UUID."""
         return cls(
-            section_id=str(uuid.uuid4()),
+            section_id=_new_id(),
             section_type=section_type,
             title=title,
             text=text,
@@ -185,7 +318,7 @@ class DetectedSection:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class Paper:
     """Immutable representation of an academic paper."""
 
@@ -224,7 +357,7 @@ class Paper:
             authors = tuple(authors)
 
         return cls(
-            paper_id=str(uuid.uuid4()),
+            paper_id=_new_id(),
             title=title,
             authors=authors,
             venue=venue,
@@ -234,7 +367,7 @@ class Paper:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class ElementCoordinates:
     """Coordinate information for highlighting extracted elements."""
 
@@ -256,7 +389,7 @@ class ElementCoordinates:
             raise InvalidCharacterPosition()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **_SLOTS)
 class ExtractedElement:
     """Immutable representation of an extracted academic element."""
 
@@ -311,7 +444,7 @@ class ExtractedElement:
     ) -> "ExtractedElement":
         """Create an ExtractedElement with automatically generated UUID."""
         return cls(
-            element_id=str(uuid.uuid4()),
+            element_id=_new_id(),
             paper_id=paper_id,
             element_type=element_type,
             text=text,
@@ -328,16 +461,31 @@ class ExtractedElement:
         )
 
 
-@dataclass(frozen=True)
+class _ElementStats(NamedTuple):
+    """Summary statistics over an extraction result's elements."""
+
+    by_type: Dict[str, int]
+    by_section: Dict[str, int]
+    average_confidence: float
+
+
+@dataclass(frozen=True, **_SLOTS)
 class ExtractionResult:
     """Immutable representation of complete extraction results for a paper."""
 
     paper: Paper
     elements: tuple[ExtractedElement, ...]
     extraction_metadata: types.MappingProxyType[str, Any] = field(
-        default_factory=lambda: types.MappingProxyType({}),
+        default_factory=lambda: _EMPTY_METADATA,
     )
     created_at: datetime = field(default_factory=datetime.now)
+    # Derived values, filled on first use
+    _stats: Optional[_ElementStats] = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     def __post_init__(self) -> None:
         """Validate extraction result data."""
@@ -356,51 +504,96 @@ class ExtractionResult:
     @property
     def elements_by_type(self) -> dict[str, int]:
         """Return count of elements by type."""
-        counts = {"goal": 0, "method": 0, "result": 0}
-        for element in self.elements:
-            counts[element.element_type] += 1
-        return counts
+        return dict(self._element_stats().by_type)
 
     @property
     def elements_by_section(self) -> dict[str, int]:
         """Return count of elements by section."""
-        counts: Dict[str, int] = {}
-        for element in self.elements:
-            counts[element.section] = counts.get(element.section, 0) + 1
-        return counts
+        return dict(self._element_stats().by_section)
 
     @property
     def average_confidence(self) -> float:
         """Return average confidence score across all elements."""
-        if not self.elements:
-            return 0.0
-        return sum(element.confidence for element in self.elements) / len(self.elements)
+        return self._element_stats().average_confidence
 
-    def filter_by_confidence(self, min_confidence: float) -> "ExtractionResult":
-        """Return new ExtractionResult with elements above confidence threshold."""
-        filtered_elements = tuple(
-            element for element in self.elements if element.confidence >= min_confidence
-        )
-        return ExtractionResult(
+    @classmethod
+    def _unchecked(
+        cls,
+        paper: Paper,
+        elements: tuple[ExtractedElement, ...],
+        extraction_metadata: types.MappingProxyType[str, Any],
+        created_at: datetime,
+    ) -> "ExtractionResult":
+        """Build a result without validation, for elements already checked."""
+        result = object.__new__(cls)
+        object.__setattr__(result, "paper", paper)
+        object.__setattr__(result, "elements", elements)
+        object.__setattr__(result, "extraction_metadata", extraction_metadata)
+        object.__setattr__(result, "created_at", created_at)
+        object.__setattr__(result, "_stats", None)
+        return result
+
+    def _element_stats(self) -> _ElementStats:
+        """Return per-type, per-section and confidence statistics, computed once."""
+        stats = self._stats
+        if stats is None:
+            by_type = {"goal": 0, "method": 0, "result": 0}
+            by_type.update(Counter(element.element_type for element in self.elements))
+            by_section = dict(Counter(element.section for element in self.elements))
+            average = (
+                sum(element.confidence for element in self.elements)
+                / len(self.elements)
+                if self.elements
+                else 0.0
+            )
+            stats = _ElementStats(by_type, by_section, average)
+            object.__setattr__(self, "_stats", stats)
+        return stats
+
+    def filter(
+        self,
+        *,
+        min_confidence: float = 0.0,
+        element_types: Optional[Collection[Literal["goal", "method", "result"]]] = None,
+    ) -> "ExtractionResult":
+        """Return new ExtractionResult keeping elements that match every criterion.
+
+        Applies both filters in one pass, so combining them does not build
+        an intermediate result.
+        """
+        if element_types is None:
+            filtered_elements = tuple(
+                element
+                for element in self.elements
+                if element.confidence >= min_confidence
+            )
+        else:
+            # frozenset() hands back a frozenset argument without copying
+            wanted_types = frozenset(element_types)
+            filtered_elements = tuple(
+                element
+                for element in self.elements
+                if element.confidence >= min_confidence
+                and element.element_type in wanted_types
+            )
+        # A subset of validated elements needs no second paper_id check
+        return self._unchecked(
             paper=self.paper,
             elements=filtered_elements,
             extraction_metadata=self.extraction_metadata,
             created_at=self.created_at,
         )
 
+    def filter_by_confidence(self, min_confidence: float) -> "ExtractionResult":
+        """Return new ExtractionResult with elements above confidence threshold."""
+        return self.filter(min_confidence=min_confidence)
+
     def filter_by_type(
         self,
-        element_types: tuple[Literal["goal", "method", "result"], ...],
+        element_types: Collection[Literal["goal", "method", "result"]],
     ) -> "ExtractionResult":
-        """Return new ExtractionResult with only specified element types."""
-        filtered_elements = tuple(
-            element
-            for element in self.elements
-            if element.element_type in element_types
-        )
-        return ExtractionResult(
-            paper=self.paper,
-            elements=filtered_elements,
-            extraction_metadata=self.extraction_metadata,
-            created_at=self.created_at,
-        )
+        """Return new ExtractionResult with only specified element types.
+
+        Any collection is accepted; pass a frozenset to reuse one across calls.
+        """
+        return self.filter(element_types=element_types)
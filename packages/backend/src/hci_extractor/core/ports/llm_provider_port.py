@@ -1,6 +1,7 @@
 """LLM Provider port interface for domain layer."""
 
 from abc import ABC, abstractmethod
+from typing import Tuple
 
 
 class LLMProviderPort(ABC):
@@ -23,3 +24,18 @@ class LLMProviderPort(ABC):
         Returns:
             Text with HTML markup tags for highlights
         """
+
+    async def generate_markup_with_status(self, text: str) -> Tuple[str, bool]:
+        """
+        Generate markup and report whether all of the text was marked up.
+
+        Providers that fall back to unmarked text for parts they could not
+        process should override this and report False in that case.
+
+        Args:
+            text: The paper text to markup
+
+        Returns:
+            Marked-up text, and True if no part fell back to unmarked text
+        """
+        return await self.generate_markup(text), True
@@ -26,6 +26,7 @@ class ConfigurationService(ConfigurationPort):
             config_path = project_root / "config.yaml"
 
         self.config_path = Path(config_path)
+        self._config_data: Optional[ConfigurationData] = None
 
         if not self.config_path.exists():
             raise ConfigurationError(
@@ -36,12 +37,25 @@ class ConfigurationService(ConfigurationPort):
     def load_configuration(self) -> ConfigurationData:
         """Load configuration from YAML file.
 
+        The file is parsed on the first call and the result reused; call
+        invalidate() to pick up later edits.
+
         Returns:
             Immutable configuration data object
 
         Raises:
             ConfigurationError: If config file cannot be loaded or is invalid
         """
+        if self._config_data is None:
+            self._config_data = self._read_configuration()
+        return self._config_data
+
+    def invalidate(self) -> None:
+        """Discard the cached configuration so the next load re-reads the file."""
+        self._config_data = None
+
+    def _read_configuration(self) -> ConfigurationData:
+        """Parse and validate the YAML configuration file."""
         try:
             with self.config_path.open("r", encoding="utf-8") as f:
                 config_dict = yaml.safe_load(f)
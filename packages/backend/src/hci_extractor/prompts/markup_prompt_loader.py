@@ -1,11 +1,19 @@
 """Simple prompt loader for markup generation."""
 
+import hashlib
 import logging
+import string
 from pathlib import Path
 from typing import Any, Dict
 
 import yaml
 
+try:
+    # libyaml's C parser, several times faster than the pure-Python one
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,6 +24,10 @@ class MarkupPromptLoader:
         """Initialize with prompts directory."""
         self.prompts_dir = prompts_dir
         self._prompts: Dict[str, Any] = {}
+        # Identifies the loaded prompt file contents, e.g. for cache keys
+        self.prompts_digest = ""
+        # Templates with static fields filled in, keyed by whether chunked
+        self._template_cache: Dict[bool, str] = {}
         self._load_prompts()
 
     def _load_prompts(self) -> None:
@@ -28,8 +40,10 @@ class MarkupPromptLoader:
             )
 
         try:
-            with open(markup_prompts_file, "r", encoding="utf-8") as f:
-                self._prompts = yaml.safe_load(f)
+            raw_prompts = markup_prompts_file.read_bytes()
+            self._prompts = yaml.load(raw_prompts, Loader=_SafeLoader)
+            self.prompts_digest = hashlib.sha256(raw_prompts).hexdigest()
+            self._template_cache.clear()
             logger.info(f"Loaded markup prompts from {markup_prompts_file}")
         except Exception as e:
             logger.exception(f"Failed to load markup prompts: {e}")
@@ -47,11 +61,12 @@ class MarkupPromptLoader:
         # Check if we have the new template structure
         if "template" in markup_config:
             # Use the new template-based approach
-            template = markup_config["template"]
+            chunked = total_chunks > 1
+            template = self._static_template(chunked)
 
             # Build chunk info if needed
             chunk_info = ""
-            if total_chunks > 1:
+            if chunked:
                 chunk_template = self._prompts.get("chunk_processing", {}).get(
                     "chunk_info_template",
                     "",
@@ -61,31 +76,7 @@ class MarkupPromptLoader:
                     total_chunks=total_chunks,
                 )
 
-                # Add chunk context if available
-                chunk_context = self._prompts.get("chunk_processing", {}).get(
-                    "chunk_context",
-                    "",
-                )
-                if chunk_context:
-                    template += f"\n\n{chunk_context}"
-
-            # Format the template with all components
-            rules = markup_config.get("rules", "")
-            if isinstance(rules, str):
-                rules = rules.strip()
-            else:
-                # Convert list to string if needed (backwards compatibility)
-                rules = "\n".join(str(rule) for rule in rules) if rules else ""
-
-            return template.format(
-                system_prompt=markup_config.get("system_prompt", "").strip(),
-                task_1_cleaning=markup_config.get("task_1_cleaning", "").strip(),
-                task_2_markup=markup_config.get("task_2_markup", "").strip(),
-                task_3_summary=markup_config.get("task_3_summary", "").strip(),
-                rules=rules,
-                text=text,
-                chunk_info=chunk_info,
-            )
+            return template.format(text=text, chunk_info=chunk_info)
         # Fallback to old structure for backwards compatibility
         # Build chunk info if needed
         chunk_info = ""
@@ -132,7 +123,68 @@ class MarkupPromptLoader:
 
         return "\n".join(prompt_parts)
 
+    def _static_template(self, chunked: bool) -> str:
+        """Return the template with every text-independent field filled in.
+
+        Only ``{text}`` and ``{chunk_info}`` are left as placeholders, so
+        each call formats just the parts that change between chunks.
+        """
+        cached = self._template_cache.get(chunked)
+        if cached is not None:
+            return cached
+
+        markup_config = self._prompts.get("markup_generation", {})
+        template = markup_config["template"]
+
+        # Add chunk context if available
+        if chunked:
+            chunk_context = self._prompts.get("chunk_processing", {}).get(
+                "chunk_context",
+                "",
+            )
+            if chunk_context:
+                template += f"\n\n{chunk_context}"
+
+        rules = markup_config.get("rules", "")
+        if isinstance(rules, str):
+            rules = rules.strip()
+        else:
+            # Convert list to string if needed (backwards compatibility)
+            rules = "\n".join(str(rule) for rule in rules) if rules else ""
+
+        fields = {
+            "system_prompt": markup_config.get("system_prompt", "").strip(),
+            "task_1_cleaning": markup_config.get("task_1_cleaning", "").strip(),
+            "task_2_markup": markup_config.get("task_2_markup", "").strip(),
+            "task_3_summary": markup_config.get("task_3_summary", "").strip(),
+            "rules": rules,
+        }
+        cached = _fill_fields(template, fields)
+        self._template_cache[chunked] = cached
+        return cached
+
     def reload_prompts(self) -> None:
         """Reload prompts from files (useful for development)."""
         self._load_prompts()
         logger.info("Reloaded markup prompts")
+
+
+def _escape_braces(text: str) -> str:
+    """Escape braces so the text survives a later str.format call."""
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def _fill_fields(template: str, fields: Dict[str, str]) -> str:
+    """Substitute the given fields, keeping other placeholders for later."""
+    parts = []
+    for literal, name, format_spec, conversion in string.Formatter().parse(template):
+        parts.append(_escape_braces(literal))
+        if name is None:
+            continue
+        if name in fields:
+            parts.append(_escape_braces(format(fields[name], format_spec or "")))
+        else:
+            conversion_suffix = f"!{conversion}" if conversion else ""
+            spec_suffix = f":{format_spec}" if format_spec else ""
+            parts.append(f"{{{name}{conversion_suffix}{spec_suffix}}}")
+    return "".join(parts)
@@ -1,9 +1,11 @@
 """LLM provider implementations for text analysis."""
 
 from .base import LLMProvider
+from .cached_provider import CachingMarkupProvider
 from .gemini_provider import GeminiProvider
 
 __all__ = [
+    "CachingMarkupProvider",
     "GeminiProvider",
     "LLMProvider",
 ]
@@ -0,0 +1,161 @@
+"""Disk cache for LLM markup responses."""
+
+import asyncio
+import hashlib
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+from hci_extractor.core.config import CacheConfig
+from hci_extractor.core.ports import LLMProviderPort
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIRECTORY = Path.home() / ".cache" / "hci_extractor"
+
+
+class CachingMarkupProvider(LLMProviderPort):
+    """Serve repeated markup requests from disk instead of the LLM.
+
+    Entries are keyed by a SHA-256 of the paper text together with a caller
+    supplied key prefix (model name and prompt version), so changing either
+    starts a fresh cache. Markup is only stored when the provider reports
+    that all of the text was marked up, so a transient failure is retried on
+    the next request instead of being served from the cache.
+
+    Expired entries are deleted when they are looked up, and after each write
+    the oldest entries are evicted until the directory fits its size limit.
+    Disk access runs in a worker thread to keep the event loop free.
+    """
+
+    def __init__(
+        self,
+        provider: LLMProviderPort,
+        cache_dir: Path,
+        key_prefix: Callable[[], str],
+        ttl_seconds: int = 0,
+        max_size_bytes: int = 0,
+    ):
+        """
+        Initialize caching wrapper.
+
+        Args:
+            provider: Provider that generates markup on a cache miss
+            cache_dir: Directory holding cached responses
+            key_prefix: Returns the current model and prompt identity; called
+                for every request so reloaded prompts start new entries
+            ttl_seconds: Maximum entry age; 0 keeps entries indefinitely
+            max_size_bytes: Maximum total size of all entries; 0 for no limit
+        """
+        self._provider = provider
+        self._cache_dir = cache_dir
+        self._key_prefix = key_prefix
+        self._ttl_seconds = ttl_seconds
+        self._max_size_bytes = max_size_bytes
+
+    async def generate_markup(self, text: str) -> str:
+        """Return cached markup for the text, generating it on a miss."""
+        marked_up_text, _ = await self.generate_markup_with_status(text)
+        return marked_up_text
+
+    async def generate_markup_with_status(self, text: str) -> Tuple[str, bool]:
+        """Return cached markup, caching a generated result only if complete."""
+        entry = self._entry_path(text)
+
+        cached = await asyncio.to_thread(self._lookup, entry)
+        if cached is not None:
+            logger.info(f"Markup cache hit: {entry.name}")
+            return cached, True
+
+        marked_up_text, complete = await self._provider.generate_markup_with_status(
+            text,
+        )
+        if complete:
+            await asyncio.to_thread(self._update, entry, marked_up_text)
+        else:
+            logger.info(f"Not caching partial markup: {entry.name}")
+        return marked_up_text, complete
+
+    def _entry_path(self, text: str) -> Path:
+        """Return the cache file for the given paper text."""
+        digest = hashlib.sha256()
+        digest.update(self._key_prefix().encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8"))
+        return self._cache_dir / f"{digest.hexdigest()}.txt"
+
+    def _lookup(self, entry: Path) -> Optional[str]:
+        """Read a cache entry, or None if missing; expired entries are deleted."""
+        try:
+            if self._ttl_seconds > 0:
+                age = time.time() - entry.stat().st_mtime
+                if age > self._ttl_seconds:
+                    entry.unlink()
+                    return None
+            return entry.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def _update(self, entry: Path, marked_up_text: str) -> None:
+        """Write a cache entry atomically; failures only cost the cache."""
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=self._cache_dir,
+                suffix=".tmp",
+                delete=False,
+            ) as temp_file:
+                temp_file.write(marked_up_text)
+            Path(temp_file.name).replace(entry)
+        except OSError as e:
+            logger.warning(f"Could not write markup cache entry {entry.name}: {e}")
+            return
+        if self._max_size_bytes > 0:
+            self._evict_oldest()
+
+    def _evict_oldest(self) -> None:
+        """Delete the least recently written entries beyond the size limit."""
+        entries = []
+        total_size = 0
+        for path in self._cache_dir.glob("*.txt"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue  # Removed concurrently
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_size += stat.st_size
+
+        if total_size <= self._max_size_bytes:
+            return
+
+        entries.sort()
+        for _, size, path in entries:
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total_size -= size
+            logger.info(f"Evicted markup cache entry {path.name}")
+            if total_size <= self._max_size_bytes:
+                break
+
+
+def with_markup_cache(
+    provider: LLMProviderPort,
+    cache_config: CacheConfig,
+    key_prefix: Callable[[], str],
+) -> LLMProviderPort:
+    """Wrap a provider in the markup cache if caching is enabled."""
+    if not cache_config.enabled:
+        return provider
+    return CachingMarkupProvider(
+        provider,
+        cache_dir=cache_config.directory or DEFAULT_CACHE_DIRECTORY,
+        key_prefix=key_prefix,
+        ttl_seconds=cache_config.ttl_seconds,
+        max_size_bytes=cache_config.max_size_mb * 1024 * 1024,
+    )
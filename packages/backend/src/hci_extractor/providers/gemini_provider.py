@@ -1,7 +1,8 @@
 """Gemini API provider implementation."""
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import google.generativeai as genai
 
@@ -28,12 +29,16 @@ logger = logging.getLogger(__name__)
 class GeminiProvider(LLMProvider):
     """Gemini API provider for LLM-based text analysis."""
 
+    # Seconds between the starts of consecutive chunk requests
+    CHUNK_REQUEST_INTERVAL = 0.5
+
     def __init__(
         self,
         provider_config: LLMProviderConfig,
         event_bus: EventBus,
         markup_prompt_loader: Optional[MarkupPromptLoader] = None,
         model_name: str = "gemini-1.5-flash",
+        max_concurrent_requests: int = 3,
     ):
         """
         Initialize Gemini provider.
@@ -43,6 +48,8 @@ class GeminiProvider(LLMProvider):
             event_bus: Event bus for publishing events
             markup_prompt_loader: MarkupPromptLoader for markup generation prompts
             model_name: Gemini model to use
+            max_concurrent_requests: Markup requests in flight at once, shared
+                by every paper this provider handles
         """
         # Initialize base class with provider-specific configuration
         super().__init__(provider_config, event_bus)
@@ -91,6 +98,10 @@ class GeminiProvider(LLMProvider):
         # Store model name for metrics
         self.model_name = model_name
 
+        # Created on first use so it binds to the serving event loop
+        self._max_concurrent_requests = max_concurrent_requests
+        self._request_slots: Optional[asyncio.Semaphore] = None
+
     async def generate_markup(self, full_text: str) -> str:
         """
         Generate HTML markup for the full text with goal/method/result tags.
@@ -102,14 +113,25 @@ class GeminiProvider(LLMProvider):
         Returns:
             Full text with HTML markup tags for highlights
         """
-        import asyncio
+        marked_up_text, _ = await self.generate_markup_with_status(full_text)
+        return marked_up_text
+
+    async def generate_markup_with_status(self, full_text: str) -> Tuple[str, bool]:
+        """
+        Generate markup and report whether every chunk was marked up.
 
+        Args:
+            full_text: Complete text to analyze and mark up
+
+        Returns:
+            Marked-up text, and False if any chunk fell back to its original text
+        """
         from hci_extractor.core.text import ChunkingMode, create_markup_chunking_service
 
         try:
             # Handle empty text
             if not full_text or not full_text.strip():
-                return ""
+                return "", True
 
             # DEBUG: Log input details
             logger.info(f"🔍 MARKUP DEBUG - Input text length: {len(full_text)}")
@@ -123,7 +145,7 @@ class GeminiProvider(LLMProvider):
                 logger.info(
                     "🔍 MARKUP DEBUG - Text fits in single chunk, processing directly",
                 )
-                return await self._process_single_chunk(full_text)
+                return await self._process_single_chunk(full_text), True
 
             # Use chunking for large documents
             logger.info("🔍 MARKUP DEBUG - Text too large, using chunking approach")
@@ -142,43 +164,25 @@ class GeminiProvider(LLMProvider):
                 f"🔍 MARKUP DEBUG - Created {len(chunks)} chunks for processing",
             )
 
-            # Process chunks with rate limiting
-            marked_chunks = []
-            for i, chunk in enumerate(chunks):
-                print(f"🔄 Processing chunk {i + 1}/{len(chunks)} ({len(chunk)} chars)")
-                print(f"   First 100 chars: {chunk[:100]!r}")
-                logger.info(
-                    f"🔍 MARKUP DEBUG - Processing chunk {i + 1}/{len(chunks)} "
-                    f"({len(chunk)} chars)"
-                )
-
-                try:
-                    marked_chunk = await self._process_single_chunk(
+            # Start chunk requests at a fixed interval and let them overlap;
+            # the interval caps the request rate without waiting on responses
+            chunk_results = await asyncio.gather(
+                *(
+                    self._process_chunk_with_fallback(
                         chunk,
                         chunk_index=i + 1,
                         total_chunks=len(chunks),
+                        start_delay=i * self.CHUNK_REQUEST_INTERVAL,
                     )
-
-                    print(
-                        f"✅ Chunk {i + 1} complete ({len(marked_chunk)} chars output)",
-                    )
-                    print(f"   First 100 chars of result: {marked_chunk[:100]!r}")
-
-                    marked_chunks.append(marked_chunk)
-
-                    # Rate limiting between chunks
-                    if i < len(chunks) - 1:  # Don't wait after last chunk
-                        await asyncio.sleep(0.5)
-
-                except Exception as e:
-                    print(f"❌ Chunk {i + 1} failed: {e}")
-                    logger.warning(
-                        f"🔍 MARKUP DEBUG - Chunk {i + 1} failed: {e}, using original"
-                    )
-                    marked_chunks.append(chunk)  # Fallback to unmarked text
+                    for i, chunk in enumerate(chunks)
+                ),
+            )
 
             # Merge chunks back together
-            full_marked_text = self._merge_marked_chunks(marked_chunks)
+            full_marked_text = self._merge_marked_chunks(
+                [marked_chunk for marked_chunk, _ in chunk_results],
+            )
+            complete = all(succeeded for _, succeeded in chunk_results)
 
             logger.info(
                 f"🔍 MARKUP DEBUG - Final merged text: {len(full_marked_text)} chars",
@@ -190,7 +194,7 @@ class GeminiProvider(LLMProvider):
                 f"🔍 MARKUP DEBUG - Merged last 200 chars: {full_marked_text[-200:]!r}",
             )
 
-            return full_marked_text
+            return full_marked_text, complete
 
         except Exception as e:
             logger.exception("Gemini API error for markup generation")
@@ -198,6 +202,48 @@ class GeminiProvider(LLMProvider):
                 raise
             raise GeminiApiError()
 
+    async def _process_chunk_with_fallback(
+        self,
+        chunk: str,
+        chunk_index: int,
+        total_chunks: int,
+        start_delay: float,
+    ) -> Tuple[str, bool]:
+        """Mark up one chunk after its scheduled delay, keeping it unmarked on error.
+
+        Returns:
+            The chunk text, and whether it was marked up rather than kept as is
+        """
+        if start_delay:
+            await asyncio.sleep(start_delay)
+
+        logger.info(
+            f"🔍 MARKUP DEBUG - Processing chunk {chunk_index}/{total_chunks} "
+            f"({len(chunk)} chars)"
+        )
+        logger.debug(f"🔍 MARKUP DEBUG - First 100 chars: {chunk[:100]!r}")
+
+        try:
+            marked_chunk = await self._process_single_chunk(
+                chunk,
+                chunk_index=chunk_index,
+                total_chunks=total_chunks,
+            )
+        except Exception as e:
+            logger.warning(
+                f"🔍 MARKUP DEBUG - Chunk {chunk_index} failed: {e}, using original"
+            )
+            return chunk, False  # Fallback to unmarked text
+
+        logger.info(
+            f"🔍 MARKUP DEBUG - Chunk {chunk_index} complete "
+            f"({len(marked_chunk)} chars output)"
+        )
+        logger.debug(
+            f"🔍 MARKUP DEBUG - First 100 chars of result: {marked_chunk[:100]!r}"
+        )
+        return marked_chunk, True
+
     async def _process_single_chunk(
         self,
         text: str,
@@ -234,6 +280,12 @@ class GeminiProvider(LLMProvider):
 
         return TextProcessingService.merge_marked_chunks(marked_chunks)
 
+    def _markup_request_slots(self) -> asyncio.Semaphore:
+        """Return the semaphore bounding concurrent markup requests."""
+        if self._request_slots is None:
+            self._request_slots = asyncio.Semaphore(self._max_concurrent_requests)
+        return self._request_slots
+
     async def _make_markup_api_request(
         self,
         prompt: str,
@@ -246,11 +298,12 @@ class GeminiProvider(LLMProvider):
             )
 
             # Generate content using Gemini with markup-specific config
-            response = await self.model.generate_content_async(
-                prompt,
-                generation_config=self.markup_generation_config,
-                **kwargs,
-            )
+            async with self._markup_request_slots():
+                response = await self.model.generate_content_async(
+                    prompt,
+                    generation_config=self.markup_generation_config,
+                    **kwargs,
+                )
 
             # Check for successful response
             if not response.text:
@@ -1,15 +1,26 @@
 """FastAPI application setup."""
 
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
 
+from hci_extractor.core.di_container import DIContainer
 from hci_extractor.core.models import (
     ConfigurationError,
     DataError,
     LLMError,
     PdfError,
 )
+from hci_extractor.web.dependencies import (
+    get_container,
+    get_llm_provider,
+    get_pdf_extractor,
+)
 from hci_extractor.web.exceptions import (
     configuration_error_handler,
     data_error_handler,
@@ -19,6 +30,37 @@ from hci_extractor.web.exceptions import (
 )
 from hci_extractor.web.routes import extract, health, websocket
 
+logger = logging.getLogger(__name__)
+
+
+def _warm_up_services(container: DIContainer) -> None:
+    """Build the shared LLM provider and PDF extractor ahead of the first upload."""
+    try:
+        get_llm_provider(container)
+        get_pdf_extractor(container)
+    except Exception as e:
+        # Requests resolve the same services again and report the error there
+        logger.warning(f"Service warm-up failed: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Warm up services in a worker thread while the server starts serving."""
+    # Create the cached container here, before any request can race to build
+    # a second one on a threadpool worker
+    try:
+        container = get_container()
+    except Exception as e:
+        logger.warning(f"Service warm-up failed: {e}")
+        yield
+        return
+
+    warm_up = asyncio.ensure_future(asyncio.to_thread(_warm_up_services, container))
+    try:
+        yield
+    finally:
+        await warm_up
+
 
 def create_app() -> FastAPI:
     """
@@ -33,6 +75,7 @@ def create_app() -> FastAPI:
         version="0.1.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        lifespan=lifespan,
     )
 
     # Add CORS middleware for frontend development
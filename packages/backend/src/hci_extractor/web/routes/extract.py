@@ -1,5 +1,6 @@
 """PDF extraction endpoints."""
 
+import asyncio
 import logging
 import re
 import tempfile
@@ -23,6 +24,10 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Every PDF file carries this header; readers accept leading junk before it
+_PDF_MAGIC = b"%PDF-"
+_PDF_HEADER_WINDOW = 1024
+
 
 def _extract_summary_from_response(text: str) -> str:
     """Extract plain language summary from LLM response.
@@ -73,17 +78,25 @@ async def extract_pdf_markup(
                 detail=f"File too large. Maximum size: {config.extraction.max_file_size_mb}MB",
             )
 
+    # Reject empty or non-PDF uploads before touching disk or the LLM
+    content = await file.read()
+    if _PDF_MAGIC not in content[:_PDF_HEADER_WINDOW]:
+        raise HTTPException(status_code=400, detail="Uploaded file is not a PDF")
+
     # Save uploaded file to temporary location
     with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_file:
-        content = await file.read()
         temp_file.write(content)
         temp_file_path = Path(temp_file.name)
 
     try:
         start_time = time.time()
 
-        # Extract PDF content
-        pdf_content = pdf_extractor.extract_content(temp_file_path)
+        # Extract PDF content in a worker thread; parsing is CPU-bound and
+        # would otherwise stall every other request on the event loop
+        pdf_content = await asyncio.to_thread(
+            pdf_extractor.extract_content,
+            temp_file_path,
+        )
 
         # DEBUG: Log PDF extraction results
         logger.info(
@@ -4,6 +4,7 @@ import pytest
 
 from hci_extractor.core.config import ExtractorConfig
 from hci_extractor.core.di_container import create_configured_container
+from hci_extractor.core.models import ConfigurationError
 from hci_extractor.infrastructure.configuration_service import ConfigurationService
 
 
@@ -66,3 +67,70 @@ class TestConfiguration:
 
         with pytest.raises(AttributeError):
             config.extraction.max_file_size_mb = 9999  # type: ignore
+
+
+class TestConfigurationServiceCaching:
+    """Test that the YAML file is parsed once per service."""
+
+    @pytest.fixture
+    def config_path(self, tmp_path):
+        """A minimal configuration file with every required section."""
+        path = tmp_path / "config.yaml"
+        sections = ("api", "extraction", "analysis", "retry", "cache", "export")
+        path.write_text(
+            "".join(f"{section}: {{}}\n" for section in sections)
+            + "general:\n  prompts_directory: prompts\n",
+            encoding="utf-8",
+        )
+        return path
+
+    def test_load_configuration_is_cached(self, config_path):
+        """Test that repeated loads return the same parsed data."""
+        config_service = ConfigurationService(config_path)
+
+        first = config_service.load_configuration()
+        config_path.write_text("not: [valid", encoding="utf-8")
+
+        assert config_service.load_configuration() is first
+
+    def test_invalidate_rereads_file(self, config_path):
+        """Test that invalidating picks up changes to the file."""
+        config_service = ConfigurationService(config_path)
+        config_service.load_configuration()
+        config_path.write_text(
+            config_path.read_text(encoding="utf-8").replace(": prompts", ": custom"),
+            encoding="utf-8",
+        )
+
+        config_service.invalidate()
+
+        config_data = config_service.load_configuration()
+        assert config_data.general["prompts_directory"] == "custom"
+
+
+class TestConfigurationFromDict:
+    """Test typed parsing of dictionary configuration."""
+
+    def test_values_are_parsed_once_to_field_types(self):
+        """Test that string values from the source become typed fields."""
+        config = ExtractorConfig.from_dict(
+            {
+                "api": {"rate_limit_delay": "0.5", "timeout_seconds": "20"},
+                "retry": {"max_attempts": "4", "backoff_multiplier": "1.5"},
+                "cache": {"ttl_seconds": "60"},
+                "export": {"min_confidence_threshold": "0.7"},
+            },
+        )
+
+        assert config.api.rate_limit_delay == 0.5
+        assert config.api.timeout_seconds == 20.0
+        assert config.retry.max_attempts == 4
+        assert config.retry.backoff_multiplier == 1.5
+        assert config.cache.ttl_seconds == 60
+        assert config.export.min_confidence_threshold == 0.7
+
+    @pytest.mark.parametrize("value", [0, -1])
+    def test_non_positive_concurrency_rejected(self, value):
+        """Test that a request limit below one fails at load, not per request."""
+        with pytest.raises(ConfigurationError, match="max_concurrent_sections"):
+            ExtractorConfig.from_dict({"analysis": {"max_concurrent_sections": value}})
@@ -1,12 +1,21 @@
 """Test dependency injection container functionality."""
 
+from dataclasses import replace
+from pathlib import Path
+
 import pytest
 
 from hci_extractor.core.config import ExtractorConfig
-from hci_extractor.core.di_container import DIContainer, create_configured_container
+from hci_extractor.core.di_container import (
+    DIContainer,
+    configure_services,
+    create_configured_container,
+)
 from hci_extractor.core.events import EventBus
+from hci_extractor.core.extraction.pdf_extractor import PdfExtractor
 from hci_extractor.core.ports.llm_provider_port import LLMProviderPort
 from hci_extractor.infrastructure.configuration_service import ConfigurationService
+from hci_extractor.prompts.markup_prompt_loader import MarkupPromptLoader
 
 
 class TestDependencyInjection:
@@ -53,6 +62,14 @@ class TestDependencyInjection:
         event_bus2 = container.resolve(EventBus)
         assert event_bus1 is event_bus2
 
+        # The LLM provider is shared so its client connections are reused
+        provider1 = container.resolve(LLMProviderPort)
+        provider2 = container.resolve(LLMProviderPort)
+        assert provider1 is provider2
+
+        # The PDF extractor is stateless and shared across uploads
+        assert container.resolve(PdfExtractor) is container.resolve(PdfExtractor)
+
     def test_transient_services_return_different_instances(self):
         """Test that transient services return different instances."""
 
@@ -90,3 +107,17 @@ class TestDependencyInjection:
 
         with pytest.raises(ValueError, match="Service .* not registered"):
             container.resolve(ExtractorConfig)
+
+    def test_prompt_loader_is_loaded_once(self):
+        """Test that prompts are parsed once and shared by every consumer."""
+        container = DIContainer()
+        configure_services(container)
+        prompts_dir = Path(__file__).parent.parent / "prompts"
+        container.register_instance(
+            ExtractorConfig,
+            replace(ExtractorConfig.from_dict({}), prompts_directory=prompts_dir),
+        )
+
+        loader = container.resolve(MarkupPromptLoader)
+
+        assert container.resolve(MarkupPromptLoader) is loader
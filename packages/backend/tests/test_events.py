@@ -0,0 +1,67 @@
+"""Tests for the domain event bus."""
+
+from hci_extractor.core.events import (
+    EventBus,
+    SectionProcessingCompleted,
+    SectionProcessingStarted,
+)
+
+
+class RecordingHandler:
+    """Handler that records every event it receives."""
+
+    def __init__(self):
+        self.events = []
+
+    def handle(self, event):
+        self.events.append(event)
+
+
+class TestEventBus:
+    """Test event bus subscription bookkeeping."""
+
+    def test_no_subscribers_on_empty_bus(self):
+        """Test that a fresh bus reports no subscribers."""
+        assert not EventBus().has_subscribers(SectionProcessingStarted)
+
+    def test_specific_subscriber_is_per_type(self):
+        """Test that a typed subscription only covers its own event type."""
+        bus = EventBus()
+        bus.subscribe(SectionProcessingCompleted, RecordingHandler())
+
+        assert bus.has_subscribers(SectionProcessingCompleted)
+        assert not bus.has_subscribers(SectionProcessingStarted)
+
+    def test_global_subscriber_covers_all_types(self):
+        """Test that a global handler counts as a subscriber for every type."""
+        bus = EventBus()
+        bus.subscribe_all(RecordingHandler())
+
+        assert bus.has_subscribers(SectionProcessingStarted)
+        assert bus.has_subscribers(SectionProcessingCompleted)
+
+    def test_clear_removes_subscribers(self):
+        """Test that clearing the bus resets subscriber state."""
+        bus = EventBus()
+        bus.subscribe(SectionProcessingStarted, RecordingHandler())
+        bus.clear()
+
+        assert not bus.has_subscribers(SectionProcessingStarted)
+
+    def test_handlers_accumulate_per_type(self):
+        """Test that repeated subscriptions keep every handler in order."""
+        bus = EventBus()
+        first, second = RecordingHandler(), RecordingHandler()
+        bus.subscribe(SectionProcessingStarted, first)
+        bus.subscribe(SectionProcessingStarted, second)
+
+        event = SectionProcessingStarted(
+            section_type="abstract",
+            section_size_chars=100,
+            paper_id="paper-1",
+            chunk_count=1,
+        )
+        bus.publish(event)
+
+        assert first.events == [event]
+        assert second.events == [event]
@@ -252,3 +252,98 @@ class TestLLMMarkupGeneration:
         result = await provider.generate_markup(short_text)
         assert isinstance(result, str)
         assert mock_model.generate_content_async.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_chunks_overlap_and_keep_order(
+        self, provider_config, mock_event_bus, mock_genai
+    ):
+        """Test that chunk requests run concurrently and merge in order."""
+        import asyncio
+
+        _, mock_model = mock_genai
+
+        mock_prompt_loader = MagicMock()
+        mock_prompt_loader.get_markup_prompt.side_effect = (
+            lambda text, chunk_index, total_chunks: str(chunk_index)
+        )
+
+        in_flight = 0
+        peak_in_flight = 0
+
+        async def generate(prompt, **kwargs):
+            nonlocal in_flight, peak_in_flight
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if prompt == "2":
+                raise RuntimeError("API Error")
+            response = MagicMock()
+            response.text = f"<marked {prompt}>"
+            return response
+
+        mock_model.generate_content_async = generate
+
+        provider = GeminiProvider(
+            provider_config=provider_config,
+            event_bus=mock_event_bus,
+            markup_prompt_loader=mock_prompt_loader,
+            model_name="gemini-1.5-flash",
+        )
+        provider.CHUNK_REQUEST_INTERVAL = 0.0
+
+        with patch.object(
+            provider, "_merge_marked_chunks", side_effect=lambda chunks: chunks
+        ):
+            marked, complete = await provider.generate_markup_with_status(
+                "This is a test paper. " * 1500,
+            )
+
+        assert peak_in_flight > 1
+        assert not complete
+        assert marked[0] == "<marked 1>"
+        # A failed chunk falls back to its unmarked text in place
+        assert not marked[1].startswith("<marked")
+        assert marked[2] == "<marked 3>"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_papers_share_request_limit(
+        self, provider_config, mock_event_bus, mock_genai
+    ):
+        """Test that markup requests from parallel papers respect one bound."""
+        import asyncio
+
+        _, mock_model = mock_genai
+
+        mock_prompt_loader = MagicMock()
+        mock_prompt_loader.get_markup_prompt.return_value = "prompt"
+
+        in_flight = 0
+        peak_in_flight = 0
+
+        async def generate(prompt, **kwargs):
+            nonlocal in_flight, peak_in_flight
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            response = MagicMock()
+            response.text = "<marked>"
+            return response
+
+        mock_model.generate_content_async = generate
+
+        provider = GeminiProvider(
+            provider_config=provider_config,
+            event_bus=mock_event_bus,
+            markup_prompt_loader=mock_prompt_loader,
+            model_name="gemini-1.5-flash",
+            max_concurrent_requests=2,
+        )
+
+        results = await asyncio.gather(
+            *(provider.generate_markup(f"Paper {i}") for i in range(5)),
+        )
+
+        assert results == ["<marked>"] * 5
+        assert peak_in_flight == 2
@@ -0,0 +1,157 @@
+"""Tests for the disk-backed markup cache."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from hci_extractor.core.config import CacheConfig
+from hci_extractor.core.ports import LLMProviderPort
+from hci_extractor.providers.cached_provider import (
+    CachingMarkupProvider,
+    with_markup_cache,
+)
+
+
+class CountingProvider(LLMProviderPort):
+    """Provider that wraps text in a tag and counts its calls."""
+
+    def __init__(self):
+        self.calls = 0
+        self.complete = True
+
+    async def generate_markup(self, text: str) -> str:
+        self.calls += 1
+        return f"<goal>{text}</goal>"
+
+    async def generate_markup_with_status(self, text: str) -> tuple[str, bool]:
+        return await self.generate_markup(text), self.complete
+
+
+class TestCachingMarkupProvider:
+    """Test cache hits, misses and expiry."""
+
+    @pytest.fixture
+    def inner(self):
+        """The provider behind the cache."""
+        return CountingProvider()
+
+    @pytest.fixture
+    def provider(self, inner, tmp_path):
+        """A caching provider over a temporary directory."""
+        return CachingMarkupProvider(inner, tmp_path / "cache", lambda: "model:v1")
+
+    @pytest.mark.asyncio
+    async def test_repeated_text_is_served_from_cache(self, provider, inner):
+        """Test that the second request for the same text skips the LLM."""
+        first = await provider.generate_markup("We study the effect.")
+        second = await provider.generate_markup("We study the effect.")
+
+        assert first == second == "<goal>We study the effect.</goal>"
+        assert inner.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_key_prefix_separates_entries(self, provider, inner, tmp_path):
+        """Test that a different model or prompt version misses the cache."""
+        await provider.generate_markup("Same text")
+        other = CachingMarkupProvider(inner, tmp_path / "cache", lambda: "model:v2")
+        await other.generate_markup("Same text")
+
+        assert inner.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_key_prefix_is_read_per_request(self, inner, tmp_path):
+        """Test that reloaded prompts stop serving entries from old prompts."""
+        prompt_version = "v1"
+        provider = CachingMarkupProvider(
+            inner,
+            tmp_path / "cache",
+            lambda: f"model:{prompt_version}",
+        )
+        await provider.generate_markup("Same text")
+        prompt_version = "v2"
+        await provider.generate_markup("Same text")
+
+        assert inner.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_partial_markup_is_not_cached(self, provider, inner, tmp_path):
+        """Test that markup with unmarked fallback chunks is regenerated."""
+        inner.complete = False
+        first = await provider.generate_markup_with_status("Long paper")
+        inner.complete = True
+        second = await provider.generate_markup_with_status("Long paper")
+        third = await provider.generate_markup_with_status("Long paper")
+
+        assert first == ("<goal>Long paper</goal>", False)
+        assert second == third == ("<goal>Long paper</goal>", True)
+        assert inner.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_regenerated(self, inner, tmp_path):
+        """Test that entries older than the TTL are deleted and regenerated."""
+        cache_dir = tmp_path / "cache"
+        provider = CachingMarkupProvider(
+            inner,
+            cache_dir,
+            lambda: "model",
+            ttl_seconds=60,
+        )
+        await provider.generate_markup("Old text")
+
+        (entry,) = cache_dir.iterdir()
+        os.utime(entry, (0, 0))
+        assert provider._lookup(entry) is None
+        assert not entry.exists()
+        await provider.generate_markup("Old text")
+
+        assert inner.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_oldest_entries_evicted_beyond_size_limit(self, inner, tmp_path):
+        """Test that writes keep the cache directory within its size limit."""
+        provider = CachingMarkupProvider(
+            inner,
+            tmp_path / "cache",
+            lambda: "model",
+            max_size_bytes=60,
+        )
+        texts = ["Paper one", "Paper two", "Paper six"]
+        for age, text in enumerate(texts):
+            await provider.generate_markup(text)
+            # Give each entry a distinct, increasing write time
+            os.utime(provider._entry_path(text), (age + 1, age + 1))
+
+        oldest, *newest = (provider._entry_path(text) for text in texts)
+        assert not oldest.exists()
+        assert all(path.exists() for path in newest)
+
+    @pytest.mark.asyncio
+    async def test_unwritable_cache_still_returns_markup(self, inner, tmp_path):
+        """Test that cache write failures do not fail the request."""
+        blocker = tmp_path / "not-a-directory"
+        blocker.write_text("", encoding="utf-8")
+        provider = CachingMarkupProvider(inner, blocker, lambda: "model")
+
+        assert await provider.generate_markup("Text") == "<goal>Text</goal>"
+
+    def test_disabled_cache_returns_provider_unchanged(self, inner):
+        """Test that the wrapper is only applied when caching is enabled."""
+        disabled = CacheConfig(
+            enabled=False,
+            directory=None,
+            ttl_seconds=3600,
+            max_size_mb=1000,
+        )
+        enabled = CacheConfig(
+            enabled=True,
+            directory=Path("cache"),
+            ttl_seconds=3600,
+            max_size_mb=1000,
+        )
+
+        assert with_markup_cache(inner, disabled, lambda: "model") is inner
+        assert isinstance(
+            with_markup_cache(inner, enabled, lambda: "model"),
+            CachingMarkupProvider,
+        )
@@ -0,0 +1,100 @@
+"""Tests for markup prompt loading and composition."""
+
+from pathlib import Path
+
+import pytest
+
+from hci_extractor.prompts.markup_prompt_loader import MarkupPromptLoader
+
+PROMPTS_YAML = """\
+markup_generation:
+  system_prompt: |
+    You annotate paper text.
+  task_1_cleaning: |
+    Clean the text.
+  task_2_markup: |
+    Tag goals, methods and results.
+  task_3_summary: |
+    Summarize.
+  rules: |
+    Keep the text verbatim.
+  template: |
+    {system_prompt}{chunk_info}
+    {task_1_cleaning}
+    {task_2_markup}
+    {task_3_summary}
+    {rules}
+    {text}
+chunk_processing:
+  chunk_info_template: " (chunk {chunk_index}/{total_chunks})"
+  chunk_context: |
+    This is one part of a longer paper.
+"""
+
+
+class TestMarkupPromptLoader:
+    """Test prompt composition from the YAML template."""
+
+    @pytest.fixture
+    def prompts_dir(self, tmp_path):
+        """A prompts directory with a minimal template file."""
+        (tmp_path / "markup_prompts.yaml").write_text(PROMPTS_YAML, encoding="utf-8")
+        return tmp_path
+
+    @pytest.fixture
+    def loader(self, prompts_dir):
+        """A loader reading the minimal template."""
+        return MarkupPromptLoader(prompts_dir)
+
+    def test_single_chunk_prompt(self, loader):
+        """Test that an unchunked prompt has no chunk info or context."""
+        prompt = loader.get_markup_prompt("Paper {body} text")
+
+        assert prompt.startswith("You annotate paper text.\n")
+        assert prompt.rstrip().endswith("Paper {body} text")
+        assert "chunk" not in prompt
+
+    def test_chunked_prompt_adds_info_and_context(self, loader):
+        """Test that chunked prompts carry their position and context."""
+        prompt = loader.get_markup_prompt("Paper text", 2, 3)
+
+        assert prompt.startswith("You annotate paper text. (chunk 2/3)\n")
+        assert "This is one part of a longer paper." in prompt
+        assert loader.get_markup_prompt("Paper text", 3, 3) != prompt
+
+    def test_braces_in_prompt_sections_are_literal(self, prompts_dir):
+        """Test that braces in prompt text are not treated as placeholders."""
+        (prompts_dir / "markup_prompts.yaml").write_text(
+            PROMPTS_YAML.replace("Keep the text verbatim.", "Escape {braces}."),
+            encoding="utf-8",
+        )
+
+        prompt = MarkupPromptLoader(prompts_dir).get_markup_prompt("Paper text")
+
+        assert "Escape {braces}." in prompt
+
+    def test_reload_picks_up_changed_template(self, loader, prompts_dir):
+        """Test that reloading discards previously composed templates."""
+        loader.get_markup_prompt("Paper text")
+        digest = loader.prompts_digest
+        (prompts_dir / "markup_prompts.yaml").write_text(
+            PROMPTS_YAML.replace("You annotate", "You mark up"),
+            encoding="utf-8",
+        )
+        loader.reload_prompts()
+
+        assert loader.get_markup_prompt("Paper text").startswith("You mark up")
+        assert loader.prompts_digest != digest
+
+    def test_missing_prompts_file(self, tmp_path):
+        """Test that a missing prompts file is reported."""
+        with pytest.raises(FileNotFoundError):
+            MarkupPromptLoader(tmp_path)
+
+    def test_shipped_prompts_compose(self):
+        """Test that the bundled prompts file renders with paper text."""
+        prompts_dir = Path(__file__).parent.parent / "prompts"
+        prompt = MarkupPromptLoader(prompts_dir).get_markup_prompt("Paper text", 1, 2)
+
+        assert "Paper text" in prompt
+        assert "larger document" in prompt
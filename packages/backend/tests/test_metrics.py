@@ -0,0 +1,70 @@
+"""Tests for metrics collection."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from hci_extractor.core.metrics import LLMUsageMetric, MetricsCollector
+
+
+def make_metric(**overrides):
+    """Build an LLM usage metric with sensible defaults."""
+    values = {
+        "timestamp": datetime.now(timezone.utc),
+        "provider": "gemini",
+        "model": "gemini-1.5-flash",
+        "operation": "analyze_section",
+        "tokens_input": 600,
+        "tokens_output": 400,
+        "tokens_total": 1000,
+        "response_time_seconds": 2.0,
+        "success": True,
+    }
+    values.update(overrides)
+    return LLMUsageMetric(**values)
+
+
+class TestMetricsCollector:
+    """Test LLM usage aggregation."""
+
+    def test_empty_summary(self):
+        """Test that a fresh collector reports zero usage."""
+        summary = MetricsCollector().get_llm_summary()
+
+        assert summary.total_requests == 0
+        assert summary.requests_by_provider == {}
+
+    def test_summary_aggregates_recorded_usage(self):
+        """Test that totals, averages and groupings reflect every record."""
+        collector = MetricsCollector()
+        collector.record_llm_usage(make_metric())
+        collector.record_llm_usage(
+            make_metric(
+                provider="openai",
+                model="gpt-4",
+                tokens_total=2000,
+                response_time_seconds=4.0,
+                success=False,
+                error_type="RateLimitError",
+            ),
+        )
+
+        summary = collector.get_llm_summary()
+
+        assert summary.total_requests == 2
+        assert summary.successful_requests == 1
+        assert summary.failed_requests == 1
+        assert summary.total_tokens == 3000
+        assert summary.total_cost_estimate == pytest.approx(0.000075 + 0.06)
+        assert summary.average_response_time == pytest.approx(3.0)
+        assert summary.requests_by_provider == {"gemini": 1, "openai": 1}
+        assert summary.tokens_by_provider == {"gemini": 1000, "openai": 2000}
+        assert summary.errors_by_type == {"RateLimitError": 1}
+
+    def test_clear_resets_usage(self):
+        """Test that clearing drops previously recorded usage."""
+        collector = MetricsCollector()
+        collector.record_llm_usage(make_metric())
+        collector.clear()
+
+        assert collector.get_llm_summary().total_requests == 0
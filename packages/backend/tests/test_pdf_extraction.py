@@ -1,12 +1,26 @@
 """Tests for PDF extraction functionality."""
 
 import tempfile
+import uuid
+from array import array
 from pathlib import Path
 
 import pytest
 
 from hci_extractor.core.config import ExtractorConfig
 from hci_extractor.core.extraction.pdf_extractor import PdfExtractor
+from hci_extractor.core.models import (
+    CharacterPositions,
+    ExtractedElement,
+    ExtractionResult,
+    Paper,
+    PdfContent,
+    PdfPage,
+)
+from hci_extractor.core.models.exceptions import (
+    InvalidBoundingBox,
+    InvalidCharacterPosition,
+)
 
 
 class TestPdfExtraction:
@@ -179,3 +193,356 @@ class TestPdfExtraction:
 
             finally:
                 temp_path.unlink(missing_ok=True)
+
+    def test_iter_pages_streams_pages(self, pdf_extractor, sample_pdf_content):
+        """Test that pages can be consumed one at a time."""
+        import fitz
+
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
+            temp_path = Path(temp_file.name)
+
+            # Create a two-page test PDF
+            doc = fitz.open()
+            for _ in range(2):
+                page = doc.new_page()
+                page.insert_text((50, 50), sample_pdf_content, fontsize=12)
+            doc.save(temp_path)
+            doc.close()
+
+            try:
+                pages = pdf_extractor.iter_pages(temp_path)
+
+                first_page = next(pages)
+                assert first_page.page_number == 1
+                assert first_page.char_count > 0
+
+                remaining = list(pages)
+                assert [page.page_number for page in remaining] == [2]
+
+            finally:
+                temp_path.unlink(missing_ok=True)
+
+    def test_iter_pages_validates_eagerly(self, pdf_extractor):
+        """Test that iter_pages raises before iteration starts."""
+        from hci_extractor.core.models.exceptions import (
+            FileNotFoundError as PDFFileNotFoundError,
+        )
+
+        with pytest.raises(PDFFileNotFoundError):
+            pdf_extractor.iter_pages(Path("/non/existent/file.pdf"))
+
+    def test_iter_pages_opens_document_lazily(
+        self,
+        pdf_extractor,
+        sample_pdf_content,
+        monkeypatch,
+    ):
+        """Test that a discarded iterator never leaves the document open."""
+        import gc
+
+        import fitz
+
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
+            temp_path = Path(temp_file.name)
+
+            doc = fitz.open()
+            for _ in range(2):
+                page = doc.new_page()
+                page.insert_text((50, 50), sample_pdf_content, fontsize=12)
+            doc.save(temp_path)
+            doc.close()
+
+            opened = []
+            open_document = pdf_extractor._open_document
+
+            def record_open(path):
+                document = open_document(path)
+                opened.append(document)
+                return document
+
+            monkeypatch.setattr(pdf_extractor, "_open_document", record_open)
+
+            try:
+                # Discarded before the first page: nothing was opened
+                pages = pdf_extractor.iter_pages(temp_path)
+                del pages
+                gc.collect()
+                assert opened == []
+
+                # Discarded part-way through: the document is closed
+                pages = pdf_extractor.iter_pages(temp_path)
+                next(pages)
+                del pages
+                gc.collect()
+                assert len(opened) == 1
+                assert opened[0].is_closed
+
+            finally:
+                temp_path.unlink(missing_ok=True)
+
+    def test_concurrent_extractions_do_not_overlap(
+        self,
+        pdf_extractor,
+        sample_pdf_content,
+        monkeypatch,
+    ):
+        """Test that extractions on several threads take turns in PyMuPDF."""
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        import fitz
+
+        temp_paths = []
+        for _ in range(2):
+            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as f:
+                temp_paths.append(Path(f.name))
+            doc = fitz.open()
+            for _ in range(3):
+                page = doc.new_page()
+                page.insert_text((50, 50), sample_pdf_content, fontsize=12)
+            doc.save(temp_paths[-1])
+            doc.close()
+
+        counter_lock = threading.Lock()
+        in_flight = 0
+        peak_in_flight = 0
+        extract_page = pdf_extractor._extract_page
+
+        def record_overlap(page, page_num):
+            nonlocal in_flight, peak_in_flight
+            with counter_lock:
+                in_flight += 1
+                peak_in_flight = max(peak_in_flight, in_flight)
+            time.sleep(0.01)
+            try:
+                return extract_page(page, page_num)
+            finally:
+                with counter_lock:
+                    in_flight -= 1
+
+        monkeypatch.setattr(pdf_extractor, "_extract_page", record_overlap)
+
+        try:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                results = list(executor.map(pdf_extractor.extract_content, temp_paths))
+
+            assert [result.total_pages for result in results] == [3, 3]
+            assert peak_in_flight == 1
+        finally:
+            for temp_path in temp_paths:
+                temp_path.unlink(missing_ok=True)
+
+    def test_sparse_page_skips_character_positions(
+        self,
+        pdf_extractor,
+        sample_pdf_content,
+    ):
+        """Test that near-empty pages are returned without positioning data."""
+        import fitz
+
+        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_file:
+            temp_path = Path(temp_file.name)
+
+            # A content page between two pages with almost no text
+            doc = fitz.open()
+            cover = doc.new_page()
+            cover.insert_text((50, 50), "Cover", fontsize=12)
+            page = doc.new_page()
+            page.insert_text((50, 50), sample_pdf_content, fontsize=12)
+            back = doc.new_page()
+            back.insert_text((50, 50), "End", fontsize=12)
+            doc.save(temp_path)
+            doc.close()
+
+            try:
+                cover_page, content_page, back_page = pdf_extractor.iter_pages(
+                    temp_path,
+                )
+
+                assert "Cover" in cover_page.text
+                assert len(cover_page.char_positions) == 0
+                assert len(content_page.char_positions) == content_page.char_count
+                # Empty positions still belong to their own page
+                assert len(back_page.char_positions) == 0
+                assert back_page.char_positions.page_number == 3
+
+            finally:
+                temp_path.unlink(missing_ok=True)
+
+
+class TestCharacterPositions:
+    """Test the column-wise character position model."""
+
+    def test_index_returns_position_view(self):
+        """Test that indexing builds a CharacterPosition for that character."""
+        positions = CharacterPositions(
+            page_number=2,
+            x=array("d", [10.0, 15.0]),
+            y=array("d", [20.0, 20.0]),
+            bbox=array("d", [10.0, 20.0, 20.0, 30.0] * 2),
+        )
+
+        second = positions[1]
+        assert len(positions) == 2
+        assert second.char_index == 1
+        assert second.page_number == 2
+        assert second.x == 15.0
+        assert second.bbox == (10.0, 20.0, 20.0, 30.0)
+        assert [p.char_index for p in positions] == [0, 1]
+
+    def test_misaligned_columns_rejected(self):
+        """Test that every character needs exactly four bbox values."""
+        with pytest.raises(InvalidBoundingBox):
+            CharacterPositions(
+                x=array("d", [1.0]),
+                y=array("d", [1.0]),
+                bbox=array("d", [1.0, 2.0]),
+            )
+
+    def test_positions_and_pages_are_hashable(self):
+        """Test that equal positions hash alike and pages stay hashable."""
+
+        def make_positions():
+            return CharacterPositions(
+                x=array("d", [10.0]),
+                y=array("d", [20.0]),
+                bbox=array("d", [10.0, 20.0, 20.0, 30.0]),
+            )
+
+        first, second = make_positions(), make_positions()
+        page = PdfPage(
+            page_number=1,
+            text="a",
+            char_count=1,
+            dimensions=(612.0, 792.0),
+            char_positions=first,
+        )
+
+        assert first == second
+        assert hash(first) == hash(second)
+        assert {first, second} == {first}
+        assert isinstance(hash(page), int)
+
+
+class TestPdfContent:
+    """Test document-level lookups across pages."""
+
+    @pytest.fixture
+    def content(self):
+        """Three pages, the middle one empty."""
+        pages = tuple(
+            PdfPage(page_number=i, text=text, char_count=len(text), dimensions=(1, 1))
+            for i, text in enumerate(("abc", "", "de"), start=1)
+        )
+        return PdfContent(file_path="paper.pdf", total_pages=3, pages=pages)
+
+    def test_get_text_at_position_crosses_pages(self, content):
+        """Test that global indices resolve to the right page and character."""
+        assert content.total_chars == 5
+        assert content.get_text_at_position(0) == ("a", 1)
+        assert content.get_text_at_position(2) == ("c", 1)
+        assert content.get_text_at_position(3) == ("d", 3)
+        assert content.get_text_at_position(4) == ("e", 3)
+
+    @pytest.mark.parametrize("char_index", [-1, 5])
+    def test_get_text_at_position_out_of_range(self, content, char_index):
+        """Test that indices outside the document are rejected."""
+        with pytest.raises(InvalidCharacterPosition):
+            content.get_text_at_position(char_index)
+
+    def test_full_text_joins_pages_once(self, content):
+        """Test that the joined text is built once and reused."""
+        assert content.full_text == "abc\n\nde"
+        assert content.full_text is content.full_text
+
+
+class TestExtractionResult:
+    """Test summary statistics and filtering of extraction results."""
+
+    @pytest.fixture
+    def result(self):
+        """A result with elements spread over types and sections."""
+        paper = Paper.create_with_auto_id(title="Paper", authors=("A. Author",))
+        specs = [
+            ("goal", "abstract", 0.9),
+            ("method", "methods", 0.6),
+            ("result", "results", 0.8),
+            ("result", "abstract", 0.5),
+        ]
+        elements = tuple(
+            ExtractedElement.create_with_auto_id(
+                paper_id=paper.paper_id,
+                element_type=element_type,
+                text=f"{element_type} text",
+                section=section,
+                confidence=confidence,
+                evidence_type="unknown",
+            )
+            for element_type, section, confidence in specs
+        )
+        return ExtractionResult(paper=paper, elements=elements)
+
+    def test_summary_statistics(self, result):
+        """Test per-type, per-section and average confidence statistics."""
+        assert result.elements_by_type == {"goal": 1, "method": 1, "result": 2}
+        assert result.elements_by_section == {
+            "abstract": 2,
+            "methods": 1,
+            "results": 1,
+        }
+        assert result.average_confidence == pytest.approx(0.7)
+
+    def test_cached_statistics_are_not_shared(self, result):
+        """Test that mutating a returned mapping leaves the result intact."""
+        result.elements_by_type["goal"] = 99
+
+        assert result.elements_by_type["goal"] == 1
+
+    def test_empty_result_statistics(self, result):
+        """Test that an empty result reports zero counts and confidence."""
+        empty = ExtractionResult(paper=result.paper, elements=())
+
+        assert empty.elements_by_type == {"goal": 0, "method": 0, "result": 0}
+        assert empty.elements_by_section == {}
+        assert empty.average_confidence == 0.0
+
+    def test_filter_combines_criteria(self, result):
+        """Test that one filter call applies confidence and type together."""
+        filtered = result.filter(min_confidence=0.7, element_types=("result",))
+
+        assert [e.confidence for e in filtered.elements] == [0.8]
+        assert filtered.paper is result.paper
+
+    def test_filter_helpers_delegate(self, result):
+        """Test that the single-criterion filters match the fused filter."""
+        by_confidence = result.filter_by_confidence(0.6)
+        by_type = result.filter_by_type(("goal", "method"))
+
+        assert by_confidence.elements == result.filter(min_confidence=0.6).elements
+        assert by_confidence.total_elements == 3
+        assert by_type.elements_by_type == {"goal": 1, "method": 1, "result": 0}
+        assert (
+            result.filter_by_type(frozenset({"goal", "method"})).elements
+            == by_type.elements
+        )
+
+    def test_filtered_result_matches_validated_construction(self, result):
+        """Test that filtering yields the same result as building it directly."""
+        filtered = result.filter(min_confidence=0.7)
+        rebuilt = ExtractionResult(
+            paper=result.paper,
+            elements=filtered.elements,
+            extraction_metadata=result.extraction_metadata,
+            created_at=result.created_at,
+        )
+
+        assert filtered == rebuilt
+        assert filtered.average_confidence == rebuilt.average_confidence
+
+    def test_auto_ids_are_unique_uuid4(self, result):
+        """Test that generated element IDs are distinct, valid UUID4 strings."""
+        ids = [element.element_id for element in result.elements]
+
+        assert len(set(ids)) == len(ids)
+        assert all(uuid.UUID(element_id).version == 4 for element_id in ids)
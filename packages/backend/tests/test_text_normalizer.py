@@ -0,0 +1,75 @@
+"""Tests for reversible text normalization."""
+
+import pytest
+
+from hci_extractor.core.extraction import TextNormalizer
+
+
+class TestTextNormalizer:
+    """Test cleaning rules and original-position tracking."""
+
+    @pytest.fixture
+    def normalizer(self):
+        """A default text normalizer."""
+        return TextNormalizer()
+
+    def test_fixes_hyphenation_across_lines(self, normalizer):
+        """Test that a word split by a hyphen and newline is rejoined."""
+        result = normalizer.normalize("inter-\nface design")
+
+        assert result.cleaned_text == "interface design"
+        assert "fix_hyphenation" in result.transformations
+        # "f" in the cleaned text maps back past the hyphen and newline
+        assert result.reverse_lookup(5) == 7
+
+    def test_collapses_spaces_and_keeps_paragraphs(self, normalizer):
+        """Test that space runs collapse while paragraph breaks survive."""
+        result = normalizer.normalize("one   two\nthree\n\n\nfour")
+
+        assert result.cleaned_text == "one two three\n\nfour"
+        assert result.reverse_lookup(4) == 6
+
+    def test_protects_citations_and_math(self, normalizer):
+        """Test that whitespace inside citations is left untouched."""
+        result = normalizer.normalize("see  [1,  2]  and x ≤ y")
+
+        assert result.cleaned_text == "see [1,  2] and x ≤ y"
+
+    def test_removes_repeated_headers(self, normalizer):
+        """Test that repeated boilerplate lines are dropped."""
+        # Single newlines become spaces first, so footers sit between paragraphs
+        raw = "\n\n".join(
+            [
+                "First page body.",
+                "© 2023 ACM",
+                "Second page body.",
+                "© 2023 ACM",
+                "Third page body.",
+                "© 2023 ACM",
+            ],
+        )
+        result = normalizer.normalize(raw)
+
+        assert "ACM" not in result.cleaned_text
+        assert "remove_headers_footers" in result.transformations
+        assert result.cleaned_text.startswith("First page body.")
+        assert result.reverse_lookup(0) == raw.index("First")
+
+    def test_reverse_lookup_outside_cleaned_text(self, normalizer):
+        """Test that positions outside the cleaned text map to -1."""
+        result = normalizer.normalize("plain text")
+
+        assert result.reverse_lookup(-1) == -1
+        assert result.reverse_lookup(len(result.cleaned_text)) == -1
+
+    @pytest.mark.parametrize(
+        "line",
+        ["12", "xiv", "Copyright 2023", "© 2023 ACM", "https://doi.org/1"],
+    )
+    def test_non_content_lines(self, normalizer, line):
+        """Test that page numbers and boilerplate are not content."""
+        assert not normalizer._is_content_line(line)
+
+    def test_content_line(self, normalizer):
+        """Test that ordinary prose is content."""
+        assert normalizer._is_content_line("We ran a study with 12 people.")
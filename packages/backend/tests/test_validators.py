@@ -0,0 +1,91 @@
+"""Tests for domain validators."""
+
+import pytest
+
+from hci_extractor.core.domain.validators import ElementValidator, SummaryValidator
+from hci_extractor.core.models.exceptions import (
+    ElementFormatError,
+    InvalidConfidenceError,
+    InvalidElementTypeError,
+    LLMValidationError,
+    MissingRequiredFieldError,
+)
+
+
+class TestElementValidator:
+    """Test element validation rules."""
+
+    @pytest.fixture
+    def valid_element(self):
+        """A well-formed extracted element."""
+        return {
+            "element_type": "goal",
+            "text": "We aim to improve accuracy.",
+            "evidence_type": "qualitative",
+            "confidence": 0.9,
+        }
+
+    def test_valid_element_passes(self, valid_element):
+        """Test that a valid element raises nothing."""
+        ElementValidator.validate_element(valid_element, 0)
+
+    def test_invalid_element_type_carries_context(self, valid_element):
+        """Test that the failing index and value are kept on the error."""
+        valid_element["element_type"] = "claim"
+
+        with pytest.raises(InvalidElementTypeError) as exc_info:
+            ElementValidator.validate_element(valid_element, 3)
+
+        assert exc_info.value.index == 3
+        assert exc_info.value.value == "claim"
+        assert str(exc_info.value) == "Invalid element type at element 3: 'claim'"
+
+    def test_missing_field_names_the_field(self, valid_element):
+        """Test that a missing field is reported by name."""
+        del valid_element["confidence"]
+
+        with pytest.raises(MissingRequiredFieldError) as exc_info:
+            ElementValidator.validate_element(valid_element, 1)
+
+        assert exc_info.value.value == "confidence"
+
+    def test_non_dict_element_rejected(self):
+        """Test that non-dict elements are rejected."""
+        with pytest.raises(ElementFormatError):
+            ElementValidator.validate_element(["not", "a", "dict"], 0)
+
+    def test_out_of_range_confidence_rejected(self, valid_element):
+        """Test that confidence must lie in [0, 1]."""
+        valid_element["confidence"] = 1.5
+
+        with pytest.raises(InvalidConfidenceError):
+            ElementValidator.validate_element(valid_element, 0)
+
+    def test_errors_are_llm_validation_errors(self, valid_element):
+        """Test that element errors are caught as LLMValidationError."""
+        valid_element["evidence_type"] = "anecdotal"
+
+        with pytest.raises(LLMValidationError):
+            ElementValidator.validate_response({"elements": [valid_element]})
+
+    def test_inclusion_requires_minimum_text(self, valid_element):
+        """Test that short or missing text is excluded."""
+        assert ElementValidator.is_valid_element_for_inclusion(valid_element)
+
+        valid_element["text"] = "Too short"
+        assert not ElementValidator.is_valid_element_for_inclusion(valid_element)
+
+        del valid_element["text"]
+        assert not ElementValidator.is_valid_element_for_inclusion(valid_element)
+
+
+class TestSummaryValidator:
+    """Test summary validation rules."""
+
+    def test_missing_summary_field(self):
+        """Test that a missing field is reported without an element index."""
+        with pytest.raises(MissingRequiredFieldError) as exc_info:
+            SummaryValidator.validate_summary({"confidence": 0.5})
+
+        assert exc_info.value.index is None
+        assert str(exc_info.value) == "Missing required field: 'summary'"
@@ -64,3 +64,177 @@ class TestWebAPI:
 
         # Even error responses should be JSON
         assert response.headers.get("content-type", "").startswith("application/json")
+
+
+class TestMarkupUploadValidation:
+    """Test upload checks that run before extraction."""
+
+    @pytest.fixture
+    def services(self):
+        """Extractor and provider doubles that record whether they were used."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        pdf_extractor = MagicMock()
+        llm_provider = MagicMock()
+        llm_provider.generate_markup = AsyncMock(return_value="")
+        return pdf_extractor, llm_provider
+
+    @pytest.fixture
+    def client(self, services):
+        """Test client with configuration and services overridden."""
+        from hci_extractor.core.config import ExtractorConfig
+        from hci_extractor.web.dependencies import (
+            get_extractor_config,
+            get_llm_provider,
+            get_pdf_extractor,
+        )
+
+        pdf_extractor, llm_provider = services
+        app = create_app()
+        app.dependency_overrides[get_extractor_config] = lambda: (
+            ExtractorConfig.from_dict({})
+        )
+        app.dependency_overrides[get_pdf_extractor] = lambda: pdf_extractor
+        app.dependency_overrides[get_llm_provider] = lambda: llm_provider
+        return TestClient(app)
+
+    @pytest.mark.parametrize("content", [b"", b"Just some text"])
+    def test_non_pdf_upload_rejected_before_extraction(
+        self,
+        client,
+        services,
+        content,
+    ):
+        """Test that files without a PDF header never reach the pipeline."""
+        pdf_extractor, llm_provider = services
+
+        response = client.post(
+            "/api/v1/extract/markup",
+            files={"file": ("paper.pdf", content, "application/pdf")},
+        )
+
+        assert response.status_code == 400
+        pdf_extractor.extract_content.assert_not_called()
+        llm_provider.generate_markup.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "content",
+        [b"\xef\xbb\xbf%PDF-1.4\n", b"junk" * 100 + b"%PDF-1.7\n"],
+    )
+    def test_pdf_header_after_leading_bytes_accepted(
+        self,
+        client,
+        services,
+        content,
+    ):
+        """Test that a PDF header within the first 1024 bytes is accepted."""
+        from unittest.mock import MagicMock
+
+        pdf_extractor, _ = services
+        pdf_extractor.extract_content.return_value = MagicMock(full_text="Text")
+
+        response = client.post(
+            "/api/v1/extract/markup",
+            files={"file": ("paper.pdf", content, "application/pdf")},
+        )
+
+        assert response.status_code == 200
+        pdf_extractor.extract_content.assert_called_once()
+
+    def test_pdf_header_beyond_window_rejected(self, client, services):
+        """Test that a header buried past the first 1024 bytes is rejected."""
+        pdf_extractor, _ = services
+
+        response = client.post(
+            "/api/v1/extract/markup",
+            files={
+                "file": ("paper.pdf", b" " * 1024 + b"%PDF-1.4\n", "application/pdf")
+            },
+        )
+
+        assert response.status_code == 400
+        pdf_extractor.extract_content.assert_not_called()
+
+    def test_extraction_runs_off_the_event_loop(self, client, services):
+        """Test that PDF parsing does not block other requests."""
+        import asyncio
+        from unittest.mock import MagicMock
+
+        pdf_extractor, _ = services
+        loop_running = []
+
+        def extract_content(path):
+            try:
+                asyncio.get_running_loop()
+                loop_running.append(True)
+            except RuntimeError:
+                loop_running.append(False)
+            return MagicMock(full_text="Paper text")
+
+        pdf_extractor.extract_content.side_effect = extract_content
+
+        response = client.post(
+            "/api/v1/extract/markup",
+            files={"file": ("paper.pdf", b"%PDF-1.4\n", "application/pdf")},
+        )
+
+        assert response.status_code == 200
+        assert loop_running == [False]
+
+
+class TestStartupWarmUp:
+    """Test that shared services are built when the app starts."""
+
+    def test_startup_resolves_provider_and_extractor(self, monkeypatch):
+        """Test that the first upload does not pay for provider setup."""
+        from unittest.mock import MagicMock
+
+        from hci_extractor.core.extraction.pdf_extractor import PdfExtractor
+        from hci_extractor.core.ports.llm_provider_port import LLMProviderPort
+        from hci_extractor.web import app as app_module
+
+        container = MagicMock()
+        monkeypatch.setattr(app_module, "get_container", lambda: container)
+
+        with TestClient(create_app()):
+            pass
+
+        resolved = [call.args[0] for call in container.resolve.call_args_list]
+        assert resolved == [LLMProviderPort, PdfExtractor]
+
+    def test_container_is_created_on_the_event_loop(self, monkeypatch):
+        """Test that warm-up cannot race a request to build the container."""
+        import asyncio
+        from unittest.mock import MagicMock
+
+        from hci_extractor.web import app as app_module
+
+        created_on_loop = []
+
+        def get_container():
+            try:
+                asyncio.get_running_loop()
+                created_on_loop.append(True)
+            except RuntimeError:
+                created_on_loop.append(False)
+            return MagicMock()
+
+        monkeypatch.setattr(app_module, "get_container", get_container)
+
+        with TestClient(create_app()):
+            pass
+
+        assert created_on_loop == [True]
+
+    def test_startup_survives_warm_up_failure(self, monkeypatch):
+        """Test that a broken configuration does not stop the server."""
+        from hci_extractor.core.models import ConfigurationError
+        from hci_extractor.web import app as app_module
+
+        def broken_container():
+            raise ConfigurationError("missing config")
+
+        monkeypatch.setattr(app_module, "get_container", broken_container)
+
+        with TestClient(create_app()) as client:
+            assert client.get("/docs").status_code == 200